@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import functools
 import heapq
 import itertools
+import logging
+import sys
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
+from databricks.labs.blueprint.parallel import Threads
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import DatabricksError
+from databricks.sdk.service.compute import ClusterDetails
 from databricks.sdk.service.jobs import Job, JobCluster, Task
 
 from databricks.labs.ucx.assessment.clusters import ClusterOwnership, ClusterInfo
@@ -15,8 +20,10 @@ from databricks.labs.ucx.assessment.jobs import JobOwnership, JobInfo
 from databricks.labs.ucx.framework.owners import AdministratorLocator
 from databricks.labs.ucx.source_code.graph import DependencyProblem
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class MigrationStep:
     step_id: int
     """Globally unique id."""
@@ -43,7 +50,7 @@ class MigrationStep:
 MigrationNodeKey = tuple[str, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MigrationNode:
     node_id: int = field(compare=False)
     """Globally unique id."""
@@ -109,7 +116,8 @@ class PriorityQueue:
 
     def __init__(self) -> None:
         self._entries: list[QueueEntry] = []
-        self._entry_finder: dict[MigrationNode, QueueEntry] = {}
+        # Keyed by node id, as hashing an integer is cheaper than hashing the node
+        self._entry_finder: dict[int, QueueEntry] = {}
         self._counter = itertools.count()  # Tiebreaker with equal priorities, then "first in, first out"
 
     def put(self, priority: int, task: MigrationNode) -> None:
@@ -117,18 +125,18 @@ class PriorityQueue:
 
         The lowest priority is retrieved from the queue first.
         """
-        if task in self._entry_finder:
+        if task.node_id in self._entry_finder:
             self._remove(task)
         count = next(self._counter)
         entry: QueueEntry = [priority, count, task]
-        self._entry_finder[task] = entry
+        self._entry_finder[task.node_id] = entry
         heapq.heappush(self._entries, entry)
 
     def get(self) -> MigrationNode | None:
         """Gets the tasks with the lowest priority."""
         while self._entries:
             _, _, task = heapq.heappop(self._entries)
-            if task == self._REMOVED:
+            if task is self._REMOVED:
                 continue
             assert isinstance(task, MigrationNode)
             self._remove(task)
@@ -137,7 +145,7 @@ class PriorityQueue:
 
     def _remove(self, task: MigrationNode) -> None:
         """Remove a task from the queue."""
-        entry = self._entry_finder.pop(task)
+        entry = self._entry_finder.pop(task.node_id)
         # The entry is also stored in self._entries.
         entry[2] = self._REMOVED
 
@@ -154,6 +162,8 @@ class MigrationSequencer:
         self._admin_locator = administrator_locator
         self._counter = itertools.count()
         self._nodes: dict[MigrationNodeKey, MigrationNode] = {}
+        # The details of the clusters referenced by tasks, None if the cluster could not be found
+        self._clusters: dict[str, ClusterDetails | None] = {}
 
         # Outgoing references contains edges in the graph pointing from a node to a set of nodes that the node
         # references. These references follow the API references, e.g. a job contains tasks in the
@@ -172,12 +182,43 @@ class MigrationSequencer:
                 Otherwise, the maybe migration node contains the dependency problems occurring during registering the
                 job.
         """
+        self._fetch_clusters(*jobs)
         nodes: list[MaybeMigrationNode] = []
         for job in jobs:
             node = self._register_job(job)
             nodes.append(node)
         return nodes
 
+    def _fetch_clusters(self, *jobs: Job) -> None:
+        """Fetch the existing clusters referenced by the job tasks concurrently.
+
+        The clusters are fetched before registering the jobs, as registering is sequential to keep the node ids stable.
+        Only the clusters of jobs that are not registered yet and that are not registered themselves are fetched.
+        """
+        cluster_ids = set[str]()
+        for job in jobs:
+            if ("JOB", str(job.job_id)) in self._nodes:
+                continue
+            tasks = job.settings.tasks if job.settings and job.settings.tasks else []
+            for task in tasks:
+                cluster_id = task.existing_cluster_id
+                if cluster_id and cluster_id not in self._clusters and ("CLUSTER", cluster_id) not in self._nodes:
+                    cluster_ids.add(cluster_id)
+        if not cluster_ids:
+            return
+        fetch_tasks = [functools.partial(self._get_cluster, cluster_id) for cluster_id in sorted(cluster_ids)]
+        clusters, errors = Threads.gather("fetching clusters", fetch_tasks)
+        if len(errors) > 0:
+            # The clusters that failed to fetch are fetched again when registering the tasks referencing them
+            logger.warning(f"Detected {len(errors)} errors while fetching clusters: {errors}")
+        self._clusters.update(clusters)
+
+    def _get_cluster(self, cluster_id: str) -> tuple[str, ClusterDetails | None]:
+        try:
+            return cluster_id, self._ws.clusters.get(cluster_id)
+        except DatabricksError:
+            return cluster_id, None
+
     def _register_job(self, job: Job) -> MaybeMigrationNode:
         """Register a single job."""
         problems: list[DependencyProblem] = []
@@ -190,7 +231,7 @@ class MigrationSequencer:
             object_type="JOB",
             object_id=str(job.job_id),
             object_name=job_name,
-            object_owner=JobOwnership(self._admin_locator).owner_of(JobInfo.from_job(job)),
+            object_owner=sys.intern(JobOwnership(self._admin_locator).owner_of(JobInfo.from_job(job))),
         )
         self._nodes[job_node.key] = job_node
         if not job.settings:
@@ -297,50 +338,58 @@ class MigrationSequencer:
         node_seen = self._nodes.get(("CLUSTER", cluster_id), None)
         if node_seen:
             return MaybeMigrationNode(node_seen, [])
-        try:
-            details = self._ws.clusters.get(cluster_id)
-        except DatabricksError:
+        if cluster_id not in self._clusters:
+            _, self._clusters[cluster_id] = self._get_cluster(cluster_id)
+        details = self._clusters[cluster_id]
+        if details is None:
             message = f"Could not find cluster: {cluster_id}"
             return MaybeMigrationNode(None, [DependencyProblem('cluster-not-found', message)])
         object_name = details.cluster_name if details and details.cluster_name else cluster_id
+        object_owner = ClusterOwnership(self._admin_locator).owner_of(ClusterInfo.from_cluster_details(details))
         cluster_node = MigrationNode(
             node_id=next(self._counter),
             object_type="CLUSTER",
             object_id=cluster_id,
             object_name=object_name,
-            object_owner=ClusterOwnership(self._admin_locator).owner_of(ClusterInfo.from_cluster_details(details)),
+            object_owner=sys.intern(object_owner),
         )
         self._nodes[cluster_node.key] = cluster_node
         # TODO register warehouses and policies
         return MaybeMigrationNode(cluster_node, [])
 
-    def generate_steps(self) -> Iterable[MigrationStep]:
+    def generate_steps(self) -> Iterator[MigrationStep]:
         """Generate the migration steps.
 
+        The steps are generated lazily, thus the sequence is computed when iterating and not all steps are held in
+        memory at once.
+
         An adapted version of the Kahn topological sort is implemented. The differences are as follows:
         - We want the same step number for all nodes with same dependency depth. Therefore, instead of pushing to a
           queue, we rebuild it once all leaf nodes are processed (these are transient leaf nodes i.e. they only become
           leaf during processing)
-        - We handle cyclic dependencies (implemented in PR #3009)
+        - We handle cyclic dependencies (implemented in PR #3009): when no node is left without unsequenced
+          references, the node with the fewest unsequenced references is pulled from the queue, which breaks the cycle
+          without a separate strongly connected components pass
         """
-        ordered_steps: list[MigrationStep] = []
         # For updating the priority of steps that depend on other steps
         incoming_references = self._invert_outgoing_to_incoming_references()
-        seen = set[MigrationNode]()
+        # The number of outgoing references that are not yet sequenced, i.e. the in-degree in Kahn's terms. Decrementing
+        # a counter avoids recomputing the set difference with the seen nodes for every update.
+        unsequenced_references = {key: len(nodes) for key, nodes in self._outgoing_references.items()}
+        seen = set[int]()  # Node ids
         queue = self._create_node_queue(self._outgoing_references)
         node = queue.get()
         while node is not None:
-            step = node.as_step(len(ordered_steps), sorted(n.node_id for n in self._outgoing_references[node.key]))
-            ordered_steps.append(step)
-            seen.add(node)
+            yield node.as_step(len(seen), sorted(n.node_id for n in self._outgoing_references[node.key]))
+            seen.add(node.node_id)
             # Update the queue priority as if the migration step was completed
-            for dependency in incoming_references[node.key]:
-                if dependency in seen:
+            # Sorted by node id, so that nodes with equal priority are queued in registration order
+            for dependency in sorted(incoming_references[node.key], key=lambda n: n.node_id):
+                if dependency.node_id in seen:
                     continue
-                priority = len(self._outgoing_references[dependency.key] - seen)
-                queue.put(priority, dependency)
+                unsequenced_references[dependency.key] -= 1
+                queue.put(unsequenced_references[dependency.key], dependency)
             node = queue.get()
-        return ordered_steps
 
     def _invert_outgoing_to_incoming_references(self) -> dict[MigrationNodeKey, set[MigrationNode]]:
         """Invert the outgoing references to incoming references."""
@@ -1,6 +1,7 @@
 from dataclasses import replace
 from io import BytesIO
 import json
+import sys
 import webbrowser
 from pathlib import Path
 from configparser import ParsingError
@@ -29,6 +30,8 @@ CANT_FIND_UCX_MSG = (
     "Make sure the current user has configured and installed UCX."
 )
 
+_ADVICES_PER_WRITE = 64
+
 
 def _get_workspace_contexts(
     w: WorkspaceClient, a: AccountClient | None = None, run_as_collection: bool = False, **named_parameters
@@ -883,8 +886,17 @@ def lint_local_code(
         )
         assert response
         path = Path(response)
+    # Write the advices in batches to avoid a write per advice, while still streaming the output
+    batch = []
     for advice in ctx.local_code_linter.lint(Path(path)):
-        print(advice)
+        batch.append(f"{advice}\n")
+        if len(batch) >= _ADVICES_PER_WRITE:
+            sys.stdout.write("".join(batch))
+            sys.stdout.flush()
+            batch.clear()
+    if batch:
+        sys.stdout.write("".join(batch))
+        sys.stdout.flush()
 
 
 @ucx.command
@@ -24,6 +24,7 @@ from databricks.labs.ucx.progress.install import ProgressTrackingInstallation
 from databricks.labs.ucx.source_code.linters.context import LinterContext
 from databricks.labs.ucx.source_code.linters.folders import LocalCodeLinter
 from databricks.labs.ucx.source_code.notebooks.loaders import NotebookLoader
+from databricks.labs.ucx.source_code.python.ast_cache import ASTCache
 from databricks.labs.ucx.workspace_access.clusters import ClusterAccess
 
 logger = logging.getLogger(__name__)
@@ -230,4 +231,5 @@ class LocalCheckoutContext(WorkspaceContext):
             self.path_lookup,
             self.dependency_resolver,
             lambda: LinterContext(self._migration_index),
+            ast_cache=ASTCache.from_user_cache_directory(),
         )
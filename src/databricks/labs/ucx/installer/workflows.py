@@ -6,7 +6,7 @@ import os.path
 import re
 import sys
 import webbrowser
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from io import StringIO
@@ -240,9 +240,16 @@ export_results()
 
 
 class DeployedWorkflows:
-    def __init__(self, ws: WorkspaceClient, install_state: InstallState):
+    def __init__(
+        self,
+        ws: WorkspaceClient,
+        install_state: InstallState,
+        *,
+        now: Callable[[], datetime] = datetime.now,
+    ):
         self._ws = ws
         self._install_state = install_state
+        self._now = now
 
     def run_workflow(self, step: str, skip_job_wait: bool = False, max_wait: timedelta = timedelta(minutes=20)) -> int:
         # this dunder variable is hiding this method from tracebacks, making it cleaner
@@ -455,10 +462,9 @@ class DeployedWorkflows:
             run_folders.append(run_folder.path)
         return run_folders
 
-    @staticmethod
-    def _readable_timedelta(epoch):
+    def _readable_timedelta(self, epoch):
         when = datetime.utcfromtimestamp(epoch)
-        duration = datetime.now() - when
+        duration = self._now() - when
         data = {}
         data["days"], remaining = divmod(duration.total_seconds(), 86_400)
         data["hours"], remaining = divmod(remaining, 3_600)
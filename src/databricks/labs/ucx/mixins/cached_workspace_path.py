@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import itertools
 import os
-from collections import OrderedDict
 from collections.abc import Generator
 from io import BytesIO
 from pathlib import PurePosixPath
@@ -17,16 +17,26 @@ from databricks.labs.ucx.source_code.base import decode_with_bom
 # lru_cache won't let us invalidate cache entries
 # so we provide our own custom lru_cache
 class _PathLruCache:
+    """A LRU-2 cache for the binary data of workspace files.
 
-    _datas: OrderedDict[PurePosixPath, bytes]
-    """Cached binary data of files, keyed by workspace path, ordered from oldest to newest."""
+    When full, the entry whose second most recent access is the oldest is evicted. Entries accessed only once are
+    evicted first, least recently used first, so that files read once during a traversal do not push out the files
+    that are read repeatedly, like shared notebooks.
+    """
+
+    _datas: dict[PurePosixPath, bytes]
+    """Cached binary data of files, keyed by workspace path."""
+
+    _accesses: dict[PurePosixPath, tuple[int, int]]
+    """The logical times of the second most recent and the most recent access, keyed by workspace path."""
 
     _max_entries: int
     """The maximum number of entries to hold in the cache."""
 
     def __init__(self, max_entries: int) -> None:
-        # Ordered from oldest to newest.
-        self._datas = OrderedDict()
+        self._datas = {}
+        self._accesses = {}
+        self._clock = itertools.count()
         self._max_entries = max_entries
 
     @classmethod
@@ -39,22 +49,33 @@ class _PathLruCache:
 
         data = self._datas.get(normalized_path, None)
         if data is not None:
-            self._datas.move_to_end(normalized_path)
+            _, last_access = self._accesses[normalized_path]
+            self._accesses[normalized_path] = (last_access, next(self._clock))
             return data
 
         # Need to bypass the _CachedPath.open() override to actually open and retrieve the file content.
         with WorkspacePath.open(cached_path, mode="rb", buffering=buffering) as workspace_file:
             data = workspace_file.read()
         if self._max_entries <= len(self._datas):
-            self._datas.popitem(last=False)
+            self._evict()
         self._datas[normalized_path] = data
+        self._accesses[normalized_path] = (-1, next(self._clock))
         return data
 
+    def _evict(self) -> None:
+        # A linear scan is fine as eviction only happens after downloading a file, which is far more expensive
+        victim = min(self._accesses, key=self._accesses.__getitem__)
+        del self._datas[victim]
+        del self._accesses[victim]
+
     def clear(self) -> None:
         self._datas.clear()
+        self._accesses.clear()
 
     def remove(self, path: _CachedPath) -> None:
-        del self._datas[self._normalize(path)]
+        normalized_path = self._normalize(path)
+        del self._datas[normalized_path]
+        del self._accesses[normalized_path]
 
 
 class _CachedPath(WorkspacePath):
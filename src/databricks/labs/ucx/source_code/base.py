@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import codecs
+import contextlib
+import contextvars
 import dataclasses
+import functools
 import io
 import logging
 import os
 import shutil
+import stat
 import sys
 from abc import abstractmethod, ABC
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PosixPath, WindowsPath
+from types import MappingProxyType
 from typing import Any, BinaryIO, TextIO, TypeVar
 
 from astroid import NodeNG  # type: ignore
@@ -315,10 +320,13 @@ class CurrentSessionState:
             return None
 
 
-SUPPORTED_EXTENSION_LANGUAGES = {
-    '.py': Language.PYTHON,
-    '.sql': Language.SQL,
-}
+# Read-only as the mapping is shared by all callers
+SUPPORTED_EXTENSION_LANGUAGES: Mapping[str, Language] = MappingProxyType(
+    {
+        '.py': Language.PYTHON,
+        '.sql': Language.SQL,
+    }
+)
 
 
 def infer_file_language_if_supported(path: Path) -> Language | None:
@@ -329,7 +337,12 @@ def infer_file_language_if_supported(path: Path) -> Language | None:
 
     Use this function to filter paths before passing it to the linters.
     """
-    return SUPPORTED_EXTENSION_LANGUAGES.get(path.suffix.lower())
+    suffix = path.suffix
+    # Most suffixes are lower case already, only lower the suffix when the exact match fails
+    language = SUPPORTED_EXTENSION_LANGUAGES.get(suffix)
+    if language is None and not suffix.islower():
+        language = SUPPORTED_EXTENSION_LANGUAGES.get(suffix.lower())
+    return language
 
 
 def _detect_encoding_bom(binary_io: BinaryIO, *, preserve_position: bool) -> str | None:
@@ -407,12 +420,85 @@ def safe_read_text(path: Path, size: int = -1) -> str | None:
         None : If error occurred during reading.
     """
     try:
+        if size < 0 and isinstance(path, (PosixPath, WindowsPath)):
+            return _read_local_text(path)
         return read_text(path, size=size)
     except (OSError, UnicodeError) as e:
         logger.warning(f"Could not read file: {path}", exc_info=e)
         return None
 
 
+_LocalTextCache = dict[Path, tuple[int, int, str]]
+"""Whole-file reads of local files with their modification time and size."""
+
+_local_text_cache: contextvars.ContextVar[_LocalTextCache | None] = contextvars.ContextVar(
+    "_local_text_cache", default=None
+)
+"""The cache that is active in the current thread, only set in :func:cache_local_text_reads."""
+
+U = TypeVar("U")
+
+
+@contextlib.contextmanager
+def cache_local_text_reads(cache: _LocalTextCache | None = None) -> Iterator[None]:
+    """Cache whole-file reads of local files within this context in the current thread, see :func:safe_read_text.
+
+    The same file is read multiple times while building the dependency graph and linting, the cache replaces the
+    open-read-close sequence with a single `stat` for unchanged files. The cache is scoped to the context so that its
+    memory is released afterward and long-lived processes do not read stale contents of files changed within the
+    timestamp granularity of the file system.
+
+    Args :
+        cache (_LocalTextCache | None) : The cache to use, to reuse it across contexts. If None, a new cache is used.
+    """
+    if _local_text_cache.get() is not None:  # Reuse the cache of the enclosing context
+        yield
+        return
+    token = _local_text_cache.set({} if cache is None else cache)
+    try:
+        yield
+    finally:
+        _local_text_cache.reset(token)
+
+
+def iter_caching_local_text_reads(iterable: Iterable[U]) -> Iterator[U]:
+    """Iterate while caching whole-file reads of local files, see :func:cache_local_text_reads.
+
+    A single cache is used for producing all the items, like the advices of a lint pass. The cache is not active while
+    the caller handles an item, thus reads of the caller are not served from the cache.
+    """
+    cache: _LocalTextCache = {}
+    iterator = iter(iterable)
+    while True:
+        with cache_local_text_reads(cache):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def _read_local_text(path: Path) -> str:
+    """Read a local file as text, see :func:read_text and :func:cache_local_text_reads."""
+    cache = _local_text_cache.get()
+    if cache is None:
+        return read_text(path)
+    stat_result = path.stat()
+    cached = cache.get(path)
+    if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        return cached[2]
+    text = read_text(path)
+    cache[path] = (stat_result.st_mtime_ns, stat_result.st_size, text)
+    return text
+
+
+def _clear_local_text_cache() -> None:
+    """Clear the cache as it cannot detect changes within the timestamp granularity of the file system."""
+    cache = _local_text_cache.get()
+    if cache is not None:
+        cache.clear()
+
+
 def write_text(path: Path, contents: str, *, encoding: str | None = None) -> int:
     """Write content to a file as text, encode according to the BOM marker if that is present.
 
@@ -427,11 +513,26 @@ def write_text(path: Path, contents: str, *, encoding: str | None = None) -> int
     Returns:
         int : The number of characters written to the file.
     """
-    if not encoding and path.exists():
-        with path.open("rb") as binary_io:
-            encoding = _detect_encoding_bom(binary_io, preserve_position=False)
-    # If encoding=None, the system locale is used for encoding (as per open()).
-    return path.write_text(contents, encoding=encoding)
+    _clear_local_text_cache()
+    if encoding:
+        return path.write_text(contents, encoding=encoding)
+    if not isinstance(path, (PosixPath, WindowsPath)):
+        # Other paths, like workspace paths, do not support updating a file in place: "r+b" opens them for reading
+        if path.exists():
+            with path.open("rb") as binary_io:
+                encoding = _detect_encoding_bom(binary_io, preserve_position=False)
+        # If encoding=None, the system locale is used for encoding (as per open()).
+        return path.write_text(contents, encoding=encoding)
+    try:
+        # Detecting the BOM and writing on a single open file saves opening the local file twice
+        binary_io = path.open("r+b")
+    except FileNotFoundError:
+        return path.write_text(contents, encoding=None)
+    with binary_io:
+        detected_encoding = _detect_encoding_bom(binary_io, preserve_position=True)
+        binary_io.truncate()
+        with io.TextIOWrapper(binary_io, encoding=detected_encoding) as text_io:
+            return text_io.write(contents)
 
 
 def safe_write_text(path: Path, contents: str, *, encoding: str | None = None) -> int | None:
@@ -452,17 +553,45 @@ LANGUAGE_COMMENT_PREFIXES = {Language.PYTHON: '#', Language.SCALA: '//', Languag
 NOTEBOOK_HEADER = "Databricks notebook source"
 
 
-def is_a_notebook(path: Path, content: str | None = None) -> bool:
+def is_a_notebook(path: Path, content: str | None = None, *, stat_result: os.stat_result | None = None) -> bool:
+    """Check if the path is a notebook.
+
+    Args :
+        path (Path) : The path to check.
+        content (str | None) : The content of the path, if already read.
+        stat_result (os.stat_result | None) : The status of the (local) path, if already retrieved.
+    """
     if isinstance(path, WorkspacePath):
         return path.is_notebook()
-    if not path.is_file():
-        return False
+    # Checking the suffix first avoids a file system call for unsupported files
     language = infer_file_language_if_supported(path)
     if not language:
         return False
     magic_header = f"{LANGUAGE_COMMENT_PREFIXES.get(language)} {NOTEBOOK_HEADER}"
+    if not isinstance(path, (PosixPath, WindowsPath)):  # For example, a DBFS path
+        if not path.is_file():
+            return False
+        if content is not None:
+            return content.startswith(magic_header)
+        return safe_read_text(path, size=len(magic_header)) == magic_header
+    if stat_result is None:
+        try:
+            stat_result = path.stat()
+        except (OSError, ValueError):
+            return False
+    if not stat.S_ISREG(stat_result.st_mode):
+        return False
     if content is not None:
         return content.startswith(magic_header)
+    return _has_magic_header(path, magic_header, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@functools.lru_cache(maxsize=8192)
+def _has_magic_header(path: Path, magic_header: str, _mtime_ns: int, _size: int) -> bool:
+    """Check if the file starts with the magic header.
+
+    The modification time and size are part of the cache key to invalidate the cache when the file changes.
+    """
     file_header = safe_read_text(path, size=len(magic_header))
     return file_header == magic_header
 
@@ -515,6 +644,7 @@ def revert_back_up_path(path: Path) -> bool | None:
     if not path_backed_up.exists():
         logger.warning(f"Backup is missing: {path_backed_up}")
         return None
+    _clear_local_text_cache()
     try:
         shutil.copyfile(path_backed_up, path)
     except OSError as e:
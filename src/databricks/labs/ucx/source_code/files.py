@@ -159,6 +159,8 @@ class ImportFileResolver(BaseImportResolver, BaseFileResolver):
         super().__init__()
         self._file_loader = file_loader
         self._allow_list = allow_list or KnownList()
+        # The known list does not change after construction, so its lookups are memoized per module name
+        self._allow_list_cache: dict[str, MaybeDependency | None] = {}
 
     def resolve_file(self, path_lookup, path: Path) -> MaybeDependency:
         absolute_path = path_lookup.resolve(path)
@@ -182,6 +184,13 @@ class ImportFileResolver(BaseImportResolver, BaseFileResolver):
         return self._fail('import-not-found', f"Could not locate import: {name}")
 
     def _resolve_allow_list(self, name: str) -> MaybeDependency | None:
+        if name in self._allow_list_cache:
+            return self._allow_list_cache[name]
+        maybe = self._resolve_allow_list_uncached(name)
+        self._allow_list_cache[name] = maybe
+        return maybe
+
+    def _resolve_allow_list_uncached(self, name: str) -> MaybeDependency | None:
         compatibility = self._allow_list.module_compatibility(name)
         if not compatibility.known:
             logger.debug(f"Resolving unknown import: {name}")
@@ -192,19 +201,15 @@ class ImportFileResolver(BaseImportResolver, BaseFileResolver):
     def _resolve_import(self, path_lookup: PathLookup, name: str) -> MaybeDependency | None:
         if not name:
             return MaybeDependency(None, [DependencyProblem("ucx-bug", "Import name is empty")])
-        parts = []
         # Relative imports use leading dots. A single leading dot indicates a relative import, starting with
         # the current package. Two or more leading dots indicate a relative import to the parent(s) of the current
         # package, one level per dot after the first.
         # see https://docs.python.org/3/reference/import.html#package-relative-imports
-        for i, rune in enumerate(name):
-            if not i and rune == '.':  # leading single dot
-                parts.append(path_lookup.cwd.as_posix())
-                continue
-            if rune != '.':
-                parts.append(name[i:].replace('.', '/'))
-                break
-            parts.append("..")
+        module_name = name.lstrip('.')
+        dot_count = len(name) - len(module_name)
+        parts = ([path_lookup.cwd.as_posix()] + [".."] * (dot_count - 1)) if dot_count else []
+        if module_name:
+            parts.append(module_name.replace('.', '/'))
         for candidate in (f'{"/".join(parts)}.py', f'{"/".join(parts)}/__init__.py'):
             relative_path = Path(candidate)
             absolute_path = path_lookup.resolve(relative_path)
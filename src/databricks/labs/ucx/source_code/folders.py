@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
+import functools
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path, PosixPath, WindowsPath
 from collections.abc import Iterable
 
 from databricks.labs.ucx.source_code.base import is_a_notebook
@@ -16,19 +20,29 @@ from databricks.labs.ucx.source_code.notebooks.loaders import NotebookLoader
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
 
 
-class Folder(SourceContainer):
-    """A source container that represents a folder."""
+logger = logging.getLogger(__name__)
 
-    # The following paths names are ignore as they do not contain source code
-    _IGNORE_PATH_NAMES = {
+# The following folder names are ignored as they do not contain source code
+_EXCLUDED_DIRS = frozenset(
+    {
         "__pycache__",
         ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
         ".git",
         ".github",
+        "node_modules",
         # Code from libraries are accessed through `imports`, not directly via the folder
         ".venv",
         "site-packages",
     }
+)
+# File system types for which listing a folder involves a network round-trip
+_NETWORK_FILE_SYSTEM_TYPES = frozenset({"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "fuse.sshfs"})
+
+
+class Folder(SourceContainer):
+    """A source container that represents a folder."""
 
     def __init__(
         self,
@@ -36,45 +50,189 @@ class Folder(SourceContainer):
         notebook_loader: NotebookLoader,
         file_loader: FileLoader,
         folder_loader: FolderLoader,
+        *,
+        children: list[tuple[Path, bool]] | None = None,
     ):
         self._path = path
         self._notebook_loader = notebook_loader
         self._file_loader = file_loader
         self._folder_loader = folder_loader
+        self._children = children
 
-    def build_dependency_graph(self, parent: DependencyGraph) -> list[DependencyProblem]:
+    def build_dependency_graph(self, parent: DependencyGraph) -> Iterable[DependencyProblem]:
         """Build the dependency graph for the folder.
 
         Here we skip certain directories, like:
         - the ones that are not source code.
+
+        The graph is built lazily while iterating over the returned problems, consume these to build the graph.
         """
-        if self._path.name in self._IGNORE_PATH_NAMES:
+        if self._path.name in _EXCLUDED_DIRS:
             return []
-        return list(self._build_dependency_graph(parent))
+        return self._build_dependency_graph(parent)
 
     def _build_dependency_graph(self, parent: DependencyGraph) -> Iterable[DependencyProblem]:
         """Build the dependency graph for the contents of the folder."""
-        for child_path in self._path.iterdir():
-            is_file = child_path.is_file()
-            is_notebook = is_a_notebook(child_path)
+        for child_path, is_file in self._iter_children():
+            if not is_file and child_path.name in _EXCLUDED_DIRS:
+                continue  # Prune the excluded folders here to not register, load and list these
+            is_notebook = is_file and is_a_notebook(child_path)
             loader = self._notebook_loader if is_notebook else self._file_loader if is_file else self._folder_loader
             dependency = Dependency(loader, child_path, inherits_context=is_notebook)
             yield from parent.register_dependency(dependency).problems
 
+    def _iter_children(self) -> Iterable[tuple[Path, bool]]:
+        """Iterate over the children of the folder with a flag indicating if the child is a file."""
+        if self._children is not None:
+            return self._children
+        return self._list_children(self._path)
+
+    @staticmethod
+    def _list_children(path: Path) -> list[tuple[Path, bool]]:
+        """List the children of a folder with a flag indicating if the child is a file.
+
+        Local folders are scanned with `os.scandir` as its entries cache the file type, avoiding a `stat` per child.
+        """
+        if not isinstance(path, (PosixPath, WindowsPath)):  # For example, a workspace path
+            return [(child_path, child_path.is_file()) for child_path in path.iterdir()]
+        with os.scandir(path) as entries:
+            return [(path / entry.name, entry.is_file()) for entry in entries]
+
+    @classmethod
+    def walk_concurrent(cls, path: Path, max_workers: int = 16) -> dict[Path, list[tuple[Path, bool]]]:
+        """List the folder and its subfolders concurrently using a thread pool.
+
+        Having multiple folders in-flight hides the latency of listing folders on a network file system. The ignored
+        folders are not listed.
+
+        Returns :
+            dict[Path, list[tuple[Path, bool]]] : The children per folder, see :meth:_list_children.
+        """
+        listings: dict[Path, list[tuple[Path, bool]]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="list-folder") as executor:
+            pending: set[Future[tuple[Path, list[tuple[Path, bool]], list[Path]]]] = set()
+            pending.add(executor.submit(cls._list_folder, path))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder_path, children, subfolders = future.result()
+                    listings[folder_path] = children
+                    for subfolder in subfolders:
+                        pending.add(executor.submit(cls._list_folder, subfolder))
+        return listings
+
+    @classmethod
+    def _list_folder(cls, path: Path) -> tuple[Path, list[tuple[Path, bool]], list[Path]]:
+        """List a folder, also returning the subfolders to list next.
+
+        Symlinked folders are not listed next as these may form a loop, these are listed when loaded instead.
+        """
+        if not isinstance(path, (PosixPath, WindowsPath)):  # For example, a workspace path
+            children = cls._list_children(path)
+            subfolders = [
+                child_path
+                for child_path, is_file in children
+                if not is_file
+                and child_path.name not in _EXCLUDED_DIRS
+                and not child_path.is_symlink()
+                and child_path.is_dir()
+            ]
+            return path, children, subfolders
+        children, subfolders = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                child_path = path / entry.name
+                children.append((child_path, entry.is_file()))
+                if entry.name not in _EXCLUDED_DIRS and entry.is_dir(follow_symlinks=False):
+                    subfolders.append(child_path)
+        return path, children, subfolders
+
     def __repr__(self):
         return f"<Folder {self._path}>"
 
 
 class FolderLoader(DependencyLoader):
-    """Load a folder."""
+    """Load a folder.
 
-    def __init__(self, notebook_loader: NotebookLoader, file_loader: FileLoader):
+    Args:
+        max_workers (int) : The number of threads to list folders on a network file system with, see
+            :meth:Folder.walk_concurrent. If one, the folders are listed one-by-one.
+    """
+
+    def __init__(self, notebook_loader: NotebookLoader, file_loader: FileLoader, *, max_workers: int = 16):
         self._notebook_loader = notebook_loader
         self._file_loader = file_loader
+        self._max_workers = max_workers
+
+    def load_dependency(self, path_lookup: PathLookup, dependency: Dependency) -> Folder | None:
+        """Load the folder as a dependency.
+
+        The file system of the folder is looked up once, its subfolders are loaded by a :class:_SubfolderLoader.
+        """
+        absolute_path = path_lookup.resolve(dependency.path)
+        if not absolute_path:
+            return None
+        listings: dict[Path, list[tuple[Path, bool]]] = {}
+        if self._max_workers > 1 and _is_on_network_file_system(absolute_path):
+            logger.debug(f"Listing folder on network file system concurrently: {absolute_path}")
+            listings = Folder.walk_concurrent(absolute_path, self._max_workers)
+        subfolder_loader = _SubfolderLoader(self._notebook_loader, self._file_loader, listings)
+        return subfolder_loader.load_folder(absolute_path)
+
+
+class _SubfolderLoader(FolderLoader):
+    """Load the subfolders of a folder loaded by :class:FolderLoader.
+
+    The listings of a concurrent walk are kept with the folder that is walked, these are not served to later loads.
+
+    Args:
+        listings (dict[Path, list[tuple[Path, bool]]]) : The prefetched children per folder, see
+            :meth:Folder.walk_concurrent. The folders without listing are listed when building the dependency graph.
+    """
+
+    def __init__(
+        self,
+        notebook_loader: NotebookLoader,
+        file_loader: FileLoader,
+        listings: dict[Path, list[tuple[Path, bool]]],
+    ):
+        super().__init__(notebook_loader, file_loader, max_workers=1)
+        self._listings = listings
 
     def load_dependency(self, path_lookup: PathLookup, dependency: Dependency) -> Folder | None:
-        """Load the folder as a dependency."""
+        """Load the subfolder as a dependency."""
         absolute_path = path_lookup.resolve(dependency.path)
         if not absolute_path:
             return None
-        return Folder(absolute_path, self._notebook_loader, self._file_loader, self)
+        return self.load_folder(absolute_path)
+
+    def load_folder(self, path: Path) -> Folder:
+        """Load the folder from its prefetched listing, if any."""
+        children = self._listings.pop(path, None)
+        return Folder(path, self._notebook_loader, self._file_loader, self, children=children)
+
+
+def _is_on_network_file_system(path: Path) -> bool:
+    """Detect if the path is on a network file system, only supported for local paths on Linux."""
+    if not isinstance(path, PosixPath):
+        return False
+    posix_path = path.as_posix()
+    for mount_point, file_system_type in _read_mounts():
+        if posix_path == mount_point or posix_path.startswith(mount_point.rstrip("/") + "/"):
+            return file_system_type in _NETWORK_FILE_SYSTEM_TYPES
+    return False
+
+
+@functools.cache
+def _read_mounts() -> list[tuple[str, str]]:
+    """Read the mount points with their file system type, the most specific mount point comes first."""
+    try:
+        lines = Path("/proc/self/mounts").read_text().splitlines()
+    except OSError:
+        return []
+    mounts = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 3:
+            mounts.append((fields[1], fields[2]))
+    return sorted(mounts, key=lambda mount: len(mount[0]), reverse=True)
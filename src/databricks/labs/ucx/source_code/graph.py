@@ -284,20 +284,41 @@ class DependencyGraphVisitor:
         self._visited_pairs: set[tuple[Path, Path]] = set()
 
     def visit(self, graph: DependencyGraph) -> bool:
-        path = graph.dependency.path
-        if self._visited is not None:
-            if path in self._visited:
-                return False
-            self._visited.add(path)
+        """Visit the graph depth-first, returns True when the visit is interrupted.
+
+        An explicit stack of child iterators is used instead of recursion, so that deeply nested graphs do not hit the
+        recursion limit. The nodes are visited in the same order as a recursive traversal would.
+        """
+        if self._mark_visited(graph):
+            return False
         if self._visit_node(graph):
             return True
-        for dependency_graph in graph.dependencies.values():
+        stack = [(graph.dependency.path, iter(graph.dependencies.values()))]
+        while stack:
+            path, dependency_graphs = stack[-1]
+            dependency_graph = next(dependency_graphs, None)
+            if dependency_graph is None:
+                stack.pop()
+                continue
             pair = (path, dependency_graph.dependency.path)
             if pair in self._visited_pairs:
                 continue
             self._visited_pairs.add(pair)
-            if self.visit(dependency_graph):
+            if self._mark_visited(dependency_graph):
+                continue
+            if self._visit_node(dependency_graph):
                 return True
+            stack.append((dependency_graph.dependency.path, iter(dependency_graph.dependencies.values())))
+        return False
+
+    def _mark_visited(self, graph: DependencyGraph) -> bool:
+        """Mark the graph as visited, returns True when it was visited before."""
+        if self._visited is None:
+            return False
+        path = graph.dependency.path
+        if path in self._visited:
+            return True
+        self._visited.add(path)
         return False
 
 
@@ -314,6 +335,8 @@ class Dependency:
     def __init__(self, loader: DependencyLoader, path: Path, inherits_context=True):
         self._loader = loader
         self._path = path
+        # Dependencies are used as keys in the dependency graphs, the path hash is computed once
+        self._hash = hash(path)
         self._inherits_context = inherits_context
 
     @property
@@ -325,10 +348,12 @@ class Dependency:
         return self._inherits_context
 
     def __hash__(self):
-        return hash(self.path)
+        return self._hash
 
     def __eq__(self, other):
-        return isinstance(other, type(self)) and self.path == other.path
+        if self is other:
+            return True
+        return isinstance(other, type(self)) and self._hash == other._hash and self._path == other._path
 
     def load(self, path_lookup: PathLookup) -> SourceContainer | None:
         return self._loader.load_dependency(path_lookup, self)
@@ -345,7 +370,7 @@ class Dependency:
 class SourceContainer(abc.ABC):
 
     @abc.abstractmethod
-    def build_dependency_graph(self, parent: DependencyGraph) -> list[DependencyProblem]: ...
+    def build_dependency_graph(self, parent: DependencyGraph) -> Iterable[DependencyProblem]: ...
 
     def build_inherited_context(self, graph: DependencyGraph, child_path: Path) -> InheritedContext:
         raise ValueError(f"Building an inherited context from {type(self).__name__} is not supported!")
@@ -475,7 +500,7 @@ class DependencyResolver:
         if container is None:
             problem = DependencyProblem('cannot-load-file', f"Could not load file {path}")
             return MaybeGraph(None, [problem])
-        problems = container.build_dependency_graph(graph)
+        problems = list(container.build_dependency_graph(graph))
         if problems:
             problems = self._make_relative_paths(problems, path)
         return MaybeGraph(graph, problems)
@@ -492,7 +517,7 @@ class DependencyResolver:
         if container is None:
             problem = DependencyProblem('cannot-load-notebook', f"Could not load notebook {path}")
             return MaybeGraph(None, [problem])
-        problems = container.build_dependency_graph(graph)
+        problems = list(container.build_dependency_graph(graph))
         if problems:
             problems = self._make_relative_paths(problems, path)
         return MaybeGraph(graph, problems)
@@ -1,3 +1,4 @@
+import dataclasses
 from typing import cast
 
 from databricks.sdk.service.workspace import Language
@@ -15,6 +16,7 @@ from databricks.labs.ucx.source_code.linters.base import (
     SqlLinter,
     Fixer,
     SqlSequentialLinter,
+    PythonFixer,
     PythonLinter,
     DfsaPyCollector,
     TablePyCollector,
@@ -34,6 +36,7 @@ from databricks.labs.ucx.source_code.linters.pyspark import (
 from databricks.labs.ucx.source_code.linters.spark_connect import SparkConnectPyLinter
 from databricks.labs.ucx.source_code.linters.table_creation import DBRv8d0PyLinter
 from databricks.labs.ucx.source_code.linters.from_table import FromTableSqlLinter
+from databricks.labs.ucx.source_code.python.python_ast import MaybeTree
 
 
 class LinterContext:
@@ -50,6 +53,8 @@ class LinterContext:
     ):
         self._index = index
         self.session_state = CurrentSessionState() if not session_state else session_state
+        # Linting mutates the session state, for example, `USE schema` statements, see :meth:reset
+        self._initial_session_state = dataclasses.replace(self.session_state)
 
         python_linters: list[PythonLinter] = []
         python_fixers: list[Fixer] = []
@@ -108,6 +113,15 @@ class LinterContext:
             Language.SQL: sql_table_collectors,
         }
 
+    def reset(self) -> None:
+        """Reset the session state to its state when constructing the context.
+
+        Resetting allows reusing the context for linting another source, which is cheaper than constructing a new
+        context. The session state is reset in-place as the linters hold a reference to it.
+        """
+        for field in dataclasses.fields(self._initial_session_state):
+            setattr(self.session_state, field.name, getattr(self._initial_session_state, field.name))
+
     def is_supported(self, language: Language) -> bool:
         return language in self._linters and language in self._fixers
 
@@ -153,9 +167,34 @@ class LinterContext:
         raise ValueError(f"Unsupported language: {language}")
 
     def apply_fixes(self, language: Language, code: str) -> str:
+        if language is Language.PYTHON:
+            return self._apply_python_fixes(code)
         linter = self.linter(language)
         for advice in linter.lint(code):
             fixer = self.fixer(language, advice.code)
             if fixer:
                 code = fixer.apply(code)
         return code
+
+    def _apply_python_fixes(self, code: str) -> str:
+        """Apply the Python fixes on a single tree.
+
+        The code is parsed once, and only converted back to source code when a fix is applied. The fixers are applied
+        once each, in the order of the advices they fix.
+        """
+        maybe_tree = MaybeTree.from_source_code(code)
+        if maybe_tree.failure:
+            return code  # Fixing does not yield parse failures, linting does
+        assert maybe_tree.tree is not None
+        tree = maybe_tree.tree
+        linter = cast(PythonLinter, self.linter(Language.PYTHON))
+        fixers: list[PythonFixer] = []
+        for advice in list(linter.lint_tree(tree)):  # Lint before fixing, as fixing mutates the tree
+            fixer = self.fixer(Language.PYTHON, advice.code)
+            if fixer and fixer not in fixers:
+                fixers.append(cast(PythonFixer, fixer))
+        if not fixers:
+            return code
+        for fixer in fixers:
+            tree = fixer.apply_tree(tree)
+        return tree.node.as_string()
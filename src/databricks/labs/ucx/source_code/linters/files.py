@@ -29,6 +29,7 @@ from databricks.labs.ucx.source_code.notebooks.cells import (
 from databricks.labs.ucx.source_code.notebooks.magic import MagicLine
 from databricks.labs.ucx.source_code.notebooks.sources import Notebook
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
+from databricks.labs.ucx.source_code.python.ast_cache import ASTCache
 from databricks.labs.ucx.source_code.python.python_ast import Tree, MaybeTree
 
 logger = logging.getLogger(__name__)
@@ -255,11 +256,14 @@ class FileLinter:
         path_lookup: PathLookup,
         context: LinterContext,
         inherited_tree: Tree | None = None,
+        *,
+        ast_cache: ASTCache | None = None,
     ):
         self._dependency = dependency
         self._path_lookup = path_lookup
         self._context = context
         self._inherited_tree = inherited_tree
+        self._ast_cache = ast_cache
 
     def lint(self) -> Iterable[Advice]:
         """Lint the file."""
@@ -281,6 +285,10 @@ class FileLinter:
 
     def _lint_file(self, local_file: LocalFile) -> Iterable[Advice]:
         """Lint a local file."""
+        if local_file.language is Language.PYTHON:
+            # Python files are the common case, lint these with the Python linter directly
+            yield from self._lint_python_file(local_file)
+            return
         try:
             linter = self._context.linter(local_file.language)
             yield from linter.lint(local_file.original_code)
@@ -288,6 +296,20 @@ class FileLinter:
             # TODO: Remove when implementing: https://github.com/databrickslabs/ucx/issues/3544
             yield Failure("unsupported-language", f"Unsupported language: {local_file.language}", -1, -1, -1, -1)
 
+    def _lint_python_file(self, local_file: LocalFile) -> Iterable[Advice]:
+        """Lint a local Python file reusing the cached tree, if present."""
+        linter = cast(PythonLinter, self._context.linter(Language.PYTHON))
+        if self._ast_cache:
+            maybe_tree = self._ast_cache.parse(self._dependency.path, local_file.original_code)
+        else:
+            maybe_tree = MaybeTree.from_source_code(local_file.original_code)
+        if maybe_tree.failure:
+            yield maybe_tree.failure
+            return
+        assert maybe_tree.tree is not None
+        tree = maybe_tree.tree
+        yield from linter.lint_tree(tree)
+
     def _lint_notebook(self, notebook: Notebook) -> Iterable[Advice]:
         """Lint a notebook."""
         notebook_linter = NotebookLinter(notebook, self._path_lookup, self._context, self._inherited_tree)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+import os
+import stat
 from collections.abc import Callable, Iterable
-from pathlib import Path
+from pathlib import Path, PosixPath, WindowsPath
 
-from databricks.labs.ucx.source_code.base import LocatedAdvice, is_a_notebook
+from databricks.labs.ucx.source_code.base import LocatedAdvice, is_a_notebook, iter_caching_local_text_reads
 from databricks.labs.ucx.source_code.files import FileLoader
 from databricks.labs.ucx.source_code.folders import FolderLoader
 from databricks.labs.ucx.source_code.graph import (
@@ -19,13 +21,18 @@ from databricks.labs.ucx.source_code.linters.context import LinterContext
 from databricks.labs.ucx.source_code.linters.graph_walkers import FixerWalker, LinterWalker
 from databricks.labs.ucx.source_code.notebooks.loaders import NotebookLoader
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
+from databricks.labs.ucx.source_code.python.ast_cache import ASTCache
 
 
 logger = logging.getLogger(__name__)
 
 
 class LocalCodeLinter:
-    """Lint local code to become Unity Catalog compatible."""
+    """Lint local code to become Unity Catalog compatible.
+
+    Args:
+        ast_cache (ASTCache | None) : The cache for parsed Python trees. If None, the trees are not cached.
+    """
 
     def __init__(
         self,
@@ -35,6 +42,8 @@ class LocalCodeLinter:
         path_lookup: PathLookup,
         dependency_resolver: DependencyResolver,
         context_factory: Callable[[], LinterContext],
+        *,
+        ast_cache: ASTCache | None = None,
     ) -> None:
         self._notebook_loader = notebook_loader
         self._file_loader = file_loader
@@ -42,6 +51,7 @@ class LocalCodeLinter:
         self._path_lookup = path_lookup
         self._dependency_resolver = dependency_resolver
         self._context_factory = context_factory
+        self._ast_cache = ast_cache
 
     def lint(self, path: Path) -> Iterable[LocatedAdvice]:
         """Lint local code generating advices on becoming Unity Catalog compatible.
@@ -50,13 +60,19 @@ class LocalCodeLinter:
             path (Path) : The path to the resource(s) to lint. If the path is a directory, then all files within the
                 directory and subdirectories are linted.
         """
-        maybe_graph = self._build_dependency_graph_from_path(path)
+        yield from iter_caching_local_text_reads(self._lint(path))
+        if self._ast_cache:
+            logger.info(f"AST cache: {self._ast_cache.hits} hits, {self._ast_cache.misses} misses")
+
+    def _lint(self, path: Path) -> Iterable[LocatedAdvice]:
+        path_lookup = self._path_lookup.with_resolve_cache()
+        maybe_graph = self._build_dependency_graph_from_path(path, path_lookup)
         if maybe_graph.problems:
             for problem in maybe_graph.problems:
                 yield problem.as_located_advice()
             return
         assert maybe_graph.graph
-        walker = LinterWalker(maybe_graph.graph, self._path_lookup, self._context_factory)
+        walker = LinterWalker(maybe_graph.graph, path_lookup, self._context_factory, ast_cache=self._ast_cache)
         yield from walker
 
     def apply(self, path: Path) -> Iterable[LocatedAdvice]:
@@ -66,44 +82,66 @@ class LocalCodeLinter:
             path (Path) : The path to the resource(s) to lint. If the path is a directory, then all files within the
                 directory and subdirectories are linted.
         """
-        maybe_graph = self._build_dependency_graph_from_path(path)
+        yield from iter_caching_local_text_reads(self._apply(path))
+
+    def _apply(self, path: Path) -> Iterable[LocatedAdvice]:
+        path_lookup = self._path_lookup.with_resolve_cache()
+        maybe_graph = self._build_dependency_graph_from_path(path, path_lookup)
         if maybe_graph.problems:
             for problem in maybe_graph.problems:
                 yield problem.as_located_advice()
             return
         assert maybe_graph.graph
-        walker = FixerWalker(maybe_graph.graph, self._path_lookup, self._context_factory)
+        walker = FixerWalker(maybe_graph.graph, path_lookup, self._context_factory)
         list(walker)  # Nothing to yield
 
-    def _build_dependency_graph_from_path(self, path: Path) -> MaybeGraph:
+    def _build_dependency_graph_from_path(self, path: Path, path_lookup: PathLookup) -> MaybeGraph:
         """Build a dependency graph from the path.
 
         It tries to load the path as a directory, file or notebook.
 
+        Parameters :
+            path (Path) : The path to build the graph from.
+            path_lookup (PathLookup) : The path lookup to resolve the path and its dependencies with.
+
         Returns :
             MaybeGraph : If the loading fails, the returned maybe graph contains a problem. Otherwise, returned maybe
             graph contains the graph.
         """
-        resolved_path = self._path_lookup.resolve(path)
+        resolved_path = path_lookup.resolve(path)
         if not resolved_path:
             problem = DependencyProblem("path-not-found", "Path not found", source_path=path)
             return MaybeGraph(None, [problem])
-        is_dir = resolved_path.is_dir()
+        stat_result = self._stat_local_path(resolved_path)
+        if stat_result is None:
+            is_dir = resolved_path.is_dir()
+        else:
+            is_dir = stat.S_ISDIR(stat_result.st_mode)
         loader: DependencyLoader
-        if is_a_notebook(resolved_path):
-            loader = self._notebook_loader
-        elif is_dir:
+        if is_dir:
             loader = self._folder_loader
+        elif is_a_notebook(resolved_path, stat_result=stat_result):
+            loader = self._notebook_loader
         else:
             loader = self._file_loader
         root_dependency = Dependency(loader, resolved_path, not is_dir)  # don't inherit context when traversing folders
-        container = root_dependency.load(self._path_lookup)
+        container = root_dependency.load(path_lookup)
         if container is None:
             problem = DependencyProblem("dependency-not-found", "Dependency not found", source_path=path)
             return MaybeGraph(None, [problem])
         session_state = self._context_factory().session_state
-        graph = DependencyGraph(root_dependency, None, self._dependency_resolver, self._path_lookup, session_state)
+        graph = DependencyGraph(root_dependency, None, self._dependency_resolver, path_lookup, session_state)
         problems = list(container.build_dependency_graph(graph))
         if problems:
             return MaybeGraph(None, problems)
         return MaybeGraph(graph, [])
+
+    @staticmethod
+    def _stat_local_path(path: Path) -> os.stat_result | None:
+        """Retrieve the status of a local path once, so that it is reused for the directory and notebook checks."""
+        if not isinstance(path, (PosixPath, WindowsPath)):
+            return None
+        try:
+            return path.stat()
+        except OSError:
+            return None
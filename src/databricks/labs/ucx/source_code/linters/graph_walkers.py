@@ -28,6 +28,7 @@ from databricks.labs.ucx.source_code.notebooks.cells import CellLanguage
 from databricks.labs.ucx.source_code.notebooks.sources import Notebook
 from databricks.labs.ucx.source_code.linters.files import FileLinter
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
+from databricks.labs.ucx.source_code.python.ast_cache import ASTCache
 from databricks.labs.ucx.source_code.python.python_ast import MaybeTree, Tree
 from databricks.labs.ucx.source_code.linters.python import PythonSequentialLinter
 
@@ -50,19 +51,32 @@ class DependencyGraphWalker(abc.ABC, Generic[T]):
         self._graph = graph
         self._path_lookup = path_lookup
 
-        self._walked_paths = set[Path]()
+        # The paths are stored as strings, which are cheaper to hash than `Path` objects. Not using `os.fspath` as
+        # workspace paths do not support it
+        self._walked_paths = set[str]()
         self._lineage = list[Dependency]()
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over the dependencies starting from the root."""
-        for dependency in self._graph.root_dependencies:
+        for dependency, path_lookup, inherited_tree in self._walk():
+            yield from self._process_dependency(dependency, path_lookup, inherited_tree)
+
+    def _walk(self) -> Iterator[tuple[Dependency, PathLookup, Tree | None]]:
+        """Walk over the dependencies starting from the root, yielding the arguments to process a dependency with.
+
+        The lineage belongs to the last yielded dependency until the next one is requested.
+        """
+        for dependency in _sorted_by_path(self._graph.root_dependencies):
             # the dependency is a root, so its path is the one to use
             # for computing lineage and building python global context
-            yield from self._iter_one(dependency, self._graph, dependency.path)
-
-    def _iter_one(self, dependency: Dependency, graph: DependencyGraph, root_path: Path) -> Iterable[T]:
-        """Iterate over a single dependency going depth first."""
-        if dependency.path in self._walked_paths:
+            yield from self._walk_one(dependency, self._graph, dependency.path)
+
+    def _walk_one(
+        self, dependency: Dependency, graph: DependencyGraph, root_path: Path
+    ) -> Iterator[tuple[Dependency, PathLookup, Tree | None]]:
+        """Walk over a single dependency going depth first."""
+        walked_path = str(dependency.path)
+        if walked_path in self._walked_paths:
             # TODO: Decide to not skip dependencies that have been walked already.
             # Open questions:
             # - Should this come before or after the lineage logging?
@@ -70,18 +84,18 @@ class DependencyGraphWalker(abc.ABC, Generic[T]):
             #   which maybe needs to be processed.
             return
         self._lineage.append(dependency)
-        self._walked_paths.add(dependency.path)
+        self._walked_paths.add(walked_path)
         self._log_walk_one(dependency)
         inherited_tree = graph.root.build_inherited_tree(root_path, dependency.path)
         path_lookup = self._path_lookup.change_directory(dependency.path.parent)
-        yield from self._process_dependency(dependency, path_lookup, inherited_tree)
+        yield dependency, path_lookup, inherited_tree
         maybe_graph = graph.locate_dependency(dependency.path)
         # missing graph problems have already been reported while building the graph
         if maybe_graph.graph:
             child_graph = maybe_graph.graph
             # This makes the implementation depth first
-            for child_dependency in child_graph.local_dependencies:
-                yield from self._iter_one(child_dependency, child_graph, root_path)
+            for child_dependency in _sorted_by_path(child_graph.local_dependencies):
+                yield from self._walk_one(child_dependency, child_graph, root_path)
         self._lineage.pop()
 
     def _log_walk_one(self, dependency: Dependency) -> None:
@@ -104,12 +118,31 @@ class DependencyGraphWalker(abc.ABC, Generic[T]):
         return list(itertools.chain(*lists))
 
 
+def _sorted_by_path(dependencies: Iterable[Dependency]) -> list[Dependency]:
+    """Sort the dependencies by path to walk these in a deterministic order.
+
+    The walk is depth first from the roots, thus each dependency is processed once after its first parent. Sorting the
+    roots makes the first parent, and with that the inherited context, of a dependency shared by multiple roots stable
+    across runs.
+    """
+    return sorted(dependencies, key=lambda dependency: str(dependency.path))
+
+
 class LinterWalker(DependencyGraphWalker[LocatedAdvice]):
     """Lint the dependencies in the graph."""
 
-    def __init__(self, graph: DependencyGraph, path_lookup: PathLookup, context_factory: Callable[[], LinterContext]):
+    def __init__(
+        self,
+        graph: DependencyGraph,
+        path_lookup: PathLookup,
+        context_factory: Callable[[], LinterContext],
+        *,
+        ast_cache: ASTCache | None = None,
+    ):
         super().__init__(graph, path_lookup)
         self._context_factory = context_factory
+        self._context: LinterContext | None = None  # Reused for linting all dependencies, see :meth:LinterContext.reset
+        self._ast_cache = ast_cache
 
     def _log_walk_one(self, dependency: Dependency) -> None:
         """Log linting a dependency"""
@@ -123,17 +156,33 @@ class LinterWalker(DependencyGraphWalker[LocatedAdvice]):
     ) -> Iterable[LocatedAdvice]:
         """Lint the dependency and yield the located advices."""
         # FileLinter determines which file/notebook linter to use
-        linter = FileLinter(dependency, path_lookup, self._context_factory(), inherited_tree)
+        context = _reuse_context(self._context, self._context_factory)
+        self._context = context
+        linter = FileLinter(dependency, path_lookup, context, inherited_tree, ast_cache=self._ast_cache)
         for advice in linter.lint():
             yield LocatedAdvice(advice, dependency.path)
 
 
+def _reuse_context(context: LinterContext | None, context_factory: Callable[[], LinterContext]) -> LinterContext:
+    """Reuse the context for processing another dependency, or create it when there is none yet."""
+    if context is None:
+        return context_factory()
+    context.reset()
+    return context
+
+
 class FixerWalker(DependencyGraphWalker[None]):
     """Fix the dependencies in the graph."""
 
-    def __init__(self, graph: DependencyGraph, path_lookup: PathLookup, context_factory: Callable[[], LinterContext]):
+    def __init__(
+        self,
+        graph: DependencyGraph,
+        path_lookup: PathLookup,
+        context_factory: Callable[[], LinterContext],
+    ):
         super().__init__(graph, path_lookup)
         self._context_factory = context_factory
+        self._context: LinterContext | None = None  # Reused for fixing all dependencies, see :meth:LinterContext.reset
 
     def _log_walk_one(self, dependency: Dependency) -> None:
         """Log fixing a dependency"""
@@ -147,7 +196,9 @@ class FixerWalker(DependencyGraphWalker[None]):
     ) -> Iterable[None]:
         """Fix the dependency."""
         # FileLinter determines which file/notebook linter to use
-        linter = FileLinter(dependency, path_lookup, self._context_factory(), inherited_tree)
+        context = _reuse_context(self._context, self._context_factory)
+        self._context = context
+        linter = FileLinter(dependency, path_lookup, context, inherited_tree)
         linter.apply()
         yield from ()
 
@@ -181,7 +232,7 @@ class _CollectorWalker(DependencyGraphWalker[S], abc.ABC):
         source = safe_read_text(dependency.path)
         if not source:
             return
-        if is_a_notebook(dependency.path):
+        if is_a_notebook(dependency.path, source):  # Passing the source avoids reading the notebook header again
             yield from self._collect_from_notebook(source, cell_language, dependency.path, inherited_tree)
         elif dependency.path.is_file():
             yield from self._collect_from_source(source, cell_language, dependency.path, inherited_tree)
@@ -10,7 +10,6 @@ from typing import Any
 from urllib.parse import parse_qsl
 
 from databricks.labs.blueprint.logger import install_logger
-from databricks.sdk.service.workspace import Language
 
 from databricks.labs.ucx.hive_metastore.table_migration_status import TableMigrationIndex, TableMigrationStatus
 from databricks.labs.ucx.source_code.base import (
@@ -19,6 +18,7 @@ from databricks.labs.ucx.source_code.base import (
     Convention,
     Deprecation,
     Failure,
+    SUPPORTED_EXTENSION_LANGUAGES,
 )
 from databricks.labs.ucx.source_code.linters.context import LinterContext
 
@@ -227,13 +227,14 @@ class QuickFixResponse:
 class LspServer:
     def __init__(self, language_support: LinterContext):
         self._languages = language_support
-        self._extensions = {".py": Language.PYTHON, ".sql": Language.SQL}
+        self._extensions = SUPPORTED_EXTENSION_LANGUAGES
 
     def _read(self, file_uri: str):
         file = Path(file_uri.removeprefix("file://"))
-        if file.suffix not in self._extensions:
-            raise KeyError(f"no language for {file.suffix}")
-        language = self._extensions[file.suffix]
+        suffix = file.suffix
+        language = self._extensions.get(suffix)
+        if language is None:
+            raise KeyError(f"no language for {suffix}")
         with file.open('r', encoding='utf8') as f:
             return f.read(), language
 
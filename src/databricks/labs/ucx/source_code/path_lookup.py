@@ -25,14 +25,52 @@ class PathLookup:
     def from_sys_path(cls, cwd: Path) -> PathLookup:
         return PathLookup(cwd, [Path(path) for path in sys.path])
 
-    def __init__(self, cwd: Path, sys_paths: list[Path]):
+    def __init__(
+        self,
+        cwd: Path,
+        sys_paths: list[Path],
+        *,
+        resolve_cache: dict[tuple[Path, Path], Path | None] | None = None,
+    ):
         self._cwd = cwd
         self._sys_paths = sys_paths
+        self._resolve_cache = resolve_cache
 
     def change_directory(self, new_working_directory: Path) -> PathLookup:
-        return PathLookup(new_working_directory, self._sys_paths)
+        return PathLookup(new_working_directory, self._sys_paths, resolve_cache=self._resolve_cache)
+
+    def with_resolve_cache(self) -> PathLookup:
+        """Create a path lookup that memoizes the resolved paths.
+
+        The memoized paths are shared with the path lookups created through :meth:change_directory, use it for a single
+        traversal over a code base that does not change during the traversal. The memoized paths are forgotten when the
+        system paths, which are shared with those path lookups too, change.
+        """
+        path_lookup = self.change_directory(self._cwd)
+        path_lookup._resolve_cache = {}
+        return path_lookup
+
+    def __getstate__(self) -> dict:
+        """Pickle the path lookup without the memoized paths, these grow with the traversal."""
+        state = self.__dict__.copy()
+        if self._resolve_cache is not None:
+            state["_resolve_cache"] = {}
+        return state
 
     def resolve(self, path: Path) -> Path | None:
+        if self._resolve_cache is None:
+            return self._resolve(path)
+        key = (self._cwd, path)
+        if key not in self._resolve_cache:
+            self._resolve_cache[key] = self._resolve(path)
+        return self._resolve_cache[key]
+
+    def _forget_resolved_paths(self) -> None:
+        """Forget the memoized paths after changing the system paths, see :meth:with_resolve_cache."""
+        if self._resolve_cache is not None:
+            self._resolve_cache.clear()
+
+    def _resolve(self, path: Path) -> Path | None:
         try:
             if path.is_absolute() and path.exists():
                 # eliminate ".." components
@@ -92,17 +130,21 @@ class PathLookup:
 
     def prepend_path(self, path: Path) -> None:
         self._sys_paths.insert(0, path)
+        self._forget_resolved_paths()
 
     def insert_path(self, index: int, path: Path) -> None:
         self._sys_paths.insert(index, path)
+        self._forget_resolved_paths()
 
     def append_path(self, path: Path) -> None:
         if path in self._sys_paths:
             return
         self._sys_paths.append(path)
+        self._forget_resolved_paths()
 
     def remove_path(self, index: int) -> None:
         del self._sys_paths[index]
+        self._forget_resolved_paths()
 
     @property
     def library_roots(self) -> list[Path]:
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from astroid.manager import AstroidManager  # type: ignore
+
+from databricks.labs.ucx.__about__ import __version__
+from databricks.labs.ucx.source_code.python.python_ast import MaybeTree, Tree
+
+
+logger = logging.getLogger(__name__)
+
+
+class ASTCache:
+    """A persistent on-disk cache for parsed Python trees.
+
+    The trees are keyed by the SHA-256 digest of the source code, the Python version and the UCX version, thus changing
+    any of these results in a cache miss. The trees are cached before applying the astroid transforms, see :meth:parse,
+    as the inference tips attached by the transforms cannot be pickled. For the trees that still cannot be pickled an
+    empty marker is stored so that pickling them is not attempted again.
+
+    Entries are not evicted on use, call :meth:prune to bound the size and age of the cache directory.
+    """
+
+    _ENTRY_SUFFIX = ".pkl"
+    _UNPICKLABLE_SUFFIX = ".unpicklable"
+    _TEMPORARY_SUFFIX = ".tmp"
+    _TEMPORARY_MAX_AGE = timedelta(hours=1)  # Temporary files not written to for longer are left by interrupted writes
+    _DISABLE_ENVIRONMENT_VARIABLE = "UCX_NO_AST_CACHE"
+
+    def __init__(self, cache_dir: Path):
+        self._cache_dir = cache_dir
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_user_cache_directory(cls) -> ASTCache | None:
+        """Create the cache in the user cache directory, `$XDG_CACHE_HOME` or else `~/.cache`.
+
+        Returns :
+            ASTCache | None : The pruned cache, or None if the cache is disabled by setting `UCX_NO_AST_CACHE`.
+        """
+        if os.environ.get(cls._DISABLE_ENVIRONMENT_VARIABLE):
+            logger.debug(f"AST cache is disabled by {cls._DISABLE_ENVIRONMENT_VARIABLE}")
+            return None
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache = cls(Path(cache_home) / "ucx" / "ast")
+        cache.prune()
+        return cache
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def parse(self, path: Path, source: str) -> MaybeTree:
+        """Parse the source code, reusing the cached tree if present.
+
+        The tree is cached before applying the astroid transforms, which are applied after getting the tree from the
+        cache the same as astroid does after parsing.
+        """
+        key = self._key(source)
+        tree = self._get(path, key)
+        if tree is None:
+            maybe_tree = MaybeTree.from_source_code(source, apply_transforms=False)
+            if maybe_tree.failure:
+                return maybe_tree
+            assert maybe_tree.tree is not None
+            tree = maybe_tree.tree
+            self._put(path, key, tree)
+        return MaybeTree(Tree(AstroidManager().visit_transforms(tree.node)), None)
+
+    def get(self, path: Path, source: str) -> Tree | None:
+        """Get the tree for the source code, or None when it is not cached."""
+        return self._get(path, self._key(source))
+
+    def _get(self, path: Path, key: str) -> Tree | None:
+        cache_path = self._cache_dir / f"{key}{self._ENTRY_SUFFIX}"
+        try:
+            with cache_path.open("rb") as f:
+                tree = pickle.load(f)
+        except FileNotFoundError:
+            tree = None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.debug(f"Ignoring corrupted AST cache entry for {path}: {cache_path}", exc_info=e)
+            tree = None
+        if not isinstance(tree, Tree):
+            self._misses += 1
+            logger.debug(f"AST cache miss: {path}")
+            return None
+        self._hits += 1
+        logger.debug(f"AST cache hit: {path}")
+        self._touch(cache_path)
+        return tree
+
+    def put(self, path: Path, source: str, tree: Tree) -> None:
+        """Store the tree for the source code.
+
+        The tree should be stored directly after parsing as linting or attaching it to other trees mutates it.
+        """
+        self._put(path, self._key(source), tree)
+
+    def _put(self, path: Path, key: str, tree: Tree) -> None:
+        unpicklable_path = self._cache_dir / f"{key}{self._UNPICKLABLE_SUFFIX}"
+        if unpicklable_path.exists():
+            self._touch(unpicklable_path)
+            return
+        try:
+            data = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError, RecursionError) as e:
+            logger.debug(f"Cannot cache AST for {path}: {e}")
+            self._write(path, unpicklable_path, b"")
+            return
+        self._write(path, self._cache_dir / f"{key}{self._ENTRY_SUFFIX}", data)
+
+    @staticmethod
+    def _touch(cache_path: Path) -> None:
+        """Refresh the modification time, which :meth:prune uses to evict the least recently used entries first."""
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+
+    def _write(self, path: Path, cache_path: Path, data: bytes) -> None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so that concurrent readers never see a partially written entry
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_path.parent, suffix=self._TEMPORARY_SUFFIX)
+        except OSError as e:
+            logger.warning(f"Cannot write AST cache entry for {path}: {cache_path}", exc_info=e)
+            return
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                f.write(data)
+            os.replace(temporary_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Cannot write AST cache entry for {path}: {cache_path}", exc_info=e)
+            Path(temporary_path).unlink(missing_ok=True)
+
+    def prune(self, *, max_bytes: int = 256 * 1024 * 1024, max_age: timedelta = timedelta(days=30)) -> None:
+        """Remove the entries not used within the maximum age, then the least recently used entries until the cache
+        directory holds at most the maximum number of bytes.
+
+        Entries become stale when the sources, the Python version or the UCX version change, as these are part of the
+        key; pruning keeps them from accumulating. Temporary files left by interrupted writes are removed too. Entries
+        removed concurrently, for example, by another UCX process, are skipped.
+        """
+        try:
+            cache_paths = list(self._cache_dir.iterdir())
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Cannot prune AST cache: {self._cache_dir}", exc_info=e)
+            return
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        for cache_path in cache_paths:
+            try:
+                stat_result = cache_path.stat()
+            except OSError:
+                continue  # Removed concurrently
+            if cache_path.suffix in {self._ENTRY_SUFFIX, self._UNPICKLABLE_SUFFIX}:
+                entries.append((stat_result.st_mtime, stat_result.st_size, cache_path))
+            elif cache_path.suffix == self._TEMPORARY_SUFFIX:
+                if stat_result.st_mtime < now - self._TEMPORARY_MAX_AGE.total_seconds():
+                    self._remove(cache_path)
+        entries.sort()  # Least recently used first
+        expired_before = now - max_age.total_seconds()
+        total_bytes = sum(size for _, size, _ in entries)
+        for modified_at, size, cache_path in entries:
+            if modified_at >= expired_before and total_bytes <= max_bytes:
+                break
+            if self._remove(cache_path):
+                total_bytes -= size
+
+    @staticmethod
+    def _remove(cache_path: Path) -> bool:
+        try:
+            cache_path.unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            logger.warning(f"Cannot prune AST cache entry: {cache_path}", exc_info=e)
+            return False
+
+    def _key(self, source: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{sys.version_info[:3]}|{__version__}|".encode())
+        digest.update(source.encode("utf-8", errors="surrogatepass"))
+        return digest.hexdigest()
+
+    def __repr__(self):
+        return f"ASTCache({self._cache_dir})"
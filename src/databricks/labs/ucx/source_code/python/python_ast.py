@@ -71,15 +71,19 @@ class MaybeTree:
             raise ValueError(f"Tree and failure should not be both given: {self}")
 
     @classmethod
-    def from_source_code(cls, code: str) -> MaybeTree:
-        """Normalize and parse the source code to get a `Tree` or parse `Failure`."""
+    def from_source_code(cls, code: str, *, apply_transforms: bool = True) -> MaybeTree:
+        """Normalize and parse the source code to get a `Tree` or parse `Failure`.
+
+        Args :
+            apply_transforms (bool) : Apply the astroid transforms, which attach the inference tips, after parsing.
+        """
         code = cls._normalize(code)
-        return cls._maybe_parse(code)
+        return cls._maybe_parse(code, apply_transforms=apply_transforms)
 
     @classmethod
-    def _maybe_parse(cls, code: str) -> MaybeTree:
+    def _maybe_parse(cls, code: str, *, apply_transforms: bool = True) -> MaybeTree:
         try:
-            root = parse(code)
+            root = parse(code, apply_transforms=apply_transforms)
             tree = Tree(root)
             return cls(tree, None)
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -206,7 +206,7 @@ def test_graph_computes_magic_run_route_recursively_in_parent_folder(simple_ctx,
     )
     container = dependency.load(simple_ctx.path_lookup)
     assert container
-    container.build_dependency_graph(root_graph)
+    list(container.build_dependency_graph(root_graph))
     roots = root_graph.root_dependencies
     assert len(roots) == 1
     assert all_ws_paths[0] in [dep.path for dep in roots]
@@ -1,6 +1,9 @@
+import logging
+from collections.abc import Iterable
 from unittest.mock import create_autospec
 
 import pytest
+from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import ResourceDoesNotExist
 from databricks.sdk.service import iam, jobs
 from databricks.sdk.service.compute import ClusterDetails, ClusterSpec
@@ -10,13 +13,21 @@ from databricks.labs.ucx.framework.owners import AdministratorLocator, Administr
 from databricks.labs.ucx.source_code.graph import DependencyProblem
 
 
-@pytest.fixture
-def admin_locator(ws):
-    """Create a mock for an `class:AdminLocator`"""
-    admin_finder = create_autospec(AdministratorFinder)
-    admin_user = iam.User(user_name="John Doe", active=True, roles=[iam.ComplexValue(value="account_admin")])
-    admin_finder.find_admin_users.return_value = (admin_user,)
-    return AdministratorLocator(ws, finders=[lambda _ws: admin_finder])
+class _StaticAdministratorFinder(AdministratorFinder):
+    """Find a single, fixed admin user without the reflection cost of an autospec."""
+
+    def find_admin_users(self) -> Iterable[iam.User]:
+        return (iam.User(user_name="John Doe", active=True, roles=[iam.ComplexValue(value="account_admin")]),)
+
+
+@pytest.fixture(scope="module")
+def admin_locator():
+    """Create an `class:AdministratorLocator` finding "John Doe" as the admin user
+
+    The locator is shared by the tests in this module: the admin user it finds, and caches, is the same for all of them
+    and the workspace client is not used by the finder.
+    """
+    return AdministratorLocator(create_autospec(WorkspaceClient), finders=[_StaticAdministratorFinder])
 
 
 def test_register_jobs_with_existing_cluster(ws, admin_locator) -> None:
@@ -58,6 +69,72 @@ def test_register_jobs_with_non_existing_cluster(ws, admin_locator) -> None:
     ]
 
 
+def test_register_jobs_with_shared_non_existing_cluster_gets_cluster_once(ws, admin_locator) -> None:
+    """Register jobs with tasks referencing the same non-existing cluster."""
+    task = jobs.Task(task_key="test-task", existing_cluster_id="non-existing-id")
+    settings = jobs.JobSettings(name="test-job", tasks=[task])
+    first_job = jobs.Job(job_id=1234, settings=settings)
+    second_job = jobs.Job(job_id=5678, settings=settings)
+
+    ws.clusters.get.side_effect = ResourceDoesNotExist("Unknown cluster")
+    sequencer = MigrationSequencer(ws, admin_locator)
+
+    maybe_nodes = sequencer.register_jobs(first_job, second_job)
+
+    assert all(maybe_node.failed for maybe_node in maybe_nodes)
+    ws.clusters.get.assert_called_once_with("non-existing-id")
+
+
+def test_register_jobs_fetches_each_existing_cluster_once(ws, admin_locator) -> None:
+    """Register jobs with tasks referencing existing clusters, some shared between jobs."""
+    first_tasks = [jobs.Task(task_key="task1", existing_cluster_id="cluster-1")]
+    second_tasks = [
+        jobs.Task(task_key="task1", existing_cluster_id="cluster-1"),
+        jobs.Task(task_key="task2", existing_cluster_id="cluster-2"),
+    ]
+    first_job = jobs.Job(job_id=1234, settings=jobs.JobSettings(name="first-job", tasks=first_tasks))
+    second_job = jobs.Job(job_id=5678, settings=jobs.JobSettings(name="second-job", tasks=second_tasks))
+
+    ws.clusters.get.side_effect = lambda cluster_id: ClusterDetails(cluster_id=cluster_id, cluster_name=cluster_id)
+    sequencer = MigrationSequencer(ws, admin_locator)
+
+    maybe_nodes = sequencer.register_jobs(first_job, second_job)
+
+    assert not any(maybe_node.failed for maybe_node in maybe_nodes)
+    assert sorted(call.args[0] for call in ws.clusters.get.call_args_list) == ["cluster-1", "cluster-2"]
+
+
+def test_register_jobs_logs_errors_fetching_clusters(caplog, ws, admin_locator) -> None:
+    """Register a job with a task referencing a cluster that fails to fetch concurrently."""
+    task = jobs.Task(task_key="test-task", existing_cluster_id="cluster-1")
+    job = jobs.Job(job_id=1234, settings=jobs.JobSettings(name="test-job", tasks=[task]))
+
+    ws.clusters.get.side_effect = [RuntimeError("Connection reset"), ClusterDetails(cluster_id="cluster-1")]
+    sequencer = MigrationSequencer(ws, admin_locator)
+
+    with caplog.at_level(logging.WARNING, logger="databricks.labs.ucx.assessment.sequencing"):
+        maybe_nodes = sequencer.register_jobs(job)
+
+    assert not any(maybe_node.failed for maybe_node in maybe_nodes)
+    assert any("Detected 1 errors while fetching clusters" in message for message in caplog.messages)
+
+
+def test_register_jobs_does_not_fetch_clusters_of_registered_jobs(ws, admin_locator) -> None:
+    """Register a job again, the clusters of its tasks are not fetched as the job is not registered again."""
+    task = jobs.Task(task_key="test-task", existing_cluster_id="cluster-1")
+    job = jobs.Job(job_id=1234, settings=jobs.JobSettings(name="test-job", tasks=[task]))
+    other_task = jobs.Task(task_key="test-task", existing_cluster_id="cluster-2")
+    same_job = jobs.Job(job_id=1234, settings=jobs.JobSettings(name="test-job", tasks=[other_task]))
+
+    ws.clusters.get.side_effect = lambda cluster_id: ClusterDetails(cluster_id=cluster_id, cluster_name=cluster_id)
+    sequencer = MigrationSequencer(ws, admin_locator)
+
+    sequencer.register_jobs(job)
+    sequencer.register_jobs(same_job)
+
+    ws.clusters.get.assert_called_once_with("cluster-1")
+
+
 def test_register_jobs_with_existing_job_cluster_key(ws, admin_locator) -> None:
     """Register a job with a task referencing a existing job cluster."""
     job_cluster = jobs.JobCluster("existing-id", ClusterSpec())
@@ -367,3 +444,54 @@ def test_sequence_steps_from_job_task_referencing_other_task(ws, admin_locator)
             required_step_ids=[1, 2],
         ),
     ]
+
+
+def test_sequence_steps_from_job_tasks_with_cyclic_dependency(ws, admin_locator) -> None:
+    """Sequence a job with two tasks depending on each other.
+
+    Sequence:
+    1. Task1  # The cycle is broken at the first registered task
+    2. Task2
+    3. Job
+    """
+    task1 = jobs.Task(task_key="task1", depends_on=[jobs.TaskDependency("task2")])
+    task2 = jobs.Task(task_key="task2", depends_on=[jobs.TaskDependency("task1")])
+    settings = jobs.JobSettings(name="job", tasks=[task1, task2])
+    job = jobs.Job(job_id=1234, settings=settings)
+    sequencer = MigrationSequencer(ws, admin_locator)
+    sequencer.register_jobs(job)
+
+    steps = list(sequencer.generate_steps())
+
+    assert [(step.object_id, step.step_number, step.required_step_ids) for step in steps] == [
+        ("1234/task1", 0, [2]),
+        ("1234/task2", 1, [1]),
+        ("1234", 2, [1, 2]),
+    ]
+
+
+def test_sequence_steps_from_job_tasks_sharing_existing_cluster(ws, admin_locator) -> None:
+    """Sequence a job with two tasks referencing the same existing cluster.
+
+    Sequence:
+    1. Cluster  # Registered once, required by both tasks
+    2. Task1
+    3. Task2
+    4. Job
+    """
+    task1 = jobs.Task(task_key="task1", existing_cluster_id="cluster-123")
+    task2 = jobs.Task(task_key="task2", existing_cluster_id="cluster-123")
+    settings = jobs.JobSettings(name="job", tasks=[task1, task2])
+    job = jobs.Job(job_id=1234, settings=settings)
+    ws.clusters.get.return_value = ClusterDetails(cluster_id="cluster-123", cluster_name="my-cluster")
+    sequencer = MigrationSequencer(ws, admin_locator)
+    sequencer.register_jobs(job)
+
+    steps = list(sequencer.generate_steps())
+
+    assert [(step.object_id, step.step_id, step.required_step_ids) for step in steps] == [
+        ("cluster-123", 2, []),
+        ("1234/task1", 1, [2]),
+        ("1234/task2", 3, [2]),
+        ("1234", 0, [1, 3]),
+    ]
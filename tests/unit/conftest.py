@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import os
 from pathlib import Path
 import sys
@@ -31,40 +32,42 @@ pytest.register_assert_rewrite('databricks.labs.blueprint.installation')
 _lock = threading.Lock()
 
 
-@pytest.fixture()
-def mock_installation() -> MockInstallation:
-    return MockInstallation(
+_MOCK_INSTALLATION_STATE = {
+    'config.yml': {
+        'connect': {
+            'host': 'adb-9999999999999999.14.azuredatabricks.net',
+            'token': '...',
+        },
+        'inventory_database': 'ucx',
+        'warehouse_id': 'abc',
+    },
+    'mapping.csv': [
         {
-            'config.yml': {
-                'connect': {
-                    'host': 'adb-9999999999999999.14.azuredatabricks.net',
-                    'token': '...',
-                },
-                'inventory_database': 'ucx',
-                'warehouse_id': 'abc',
-            },
-            'mapping.csv': [
-                {
-                    'catalog_name': 'catalog',
-                    'dst_schema': 'schema',
-                    'dst_table': 'table',
-                    'src_schema': 'schema',
-                    'src_table': 'table',
-                    'workspace_name': 'workspace',
-                },
-            ],
-            'state.json': {'resources': {'jobs': {'test': '123', 'assessment': '456'}}},
-            'pipeline_mapping.csv': [
-                {
-                    'src_pipeline_id': '123',
-                    'target_catalog_name': 'catalog',
-                    'target_schema_name': 'schema',
-                    'target_pipeline_name': 'pipeline',
-                    'workspace_name': 'workspace',
-                }
-            ],
+            'catalog_name': 'catalog',
+            'dst_schema': 'schema',
+            'dst_table': 'table',
+            'src_schema': 'schema',
+            'src_table': 'table',
+            'workspace_name': 'workspace',
+        },
+    ],
+    'state.json': {'resources': {'jobs': {'test': '123', 'assessment': '456'}}},
+    'pipeline_mapping.csv': [
+        {
+            'src_pipeline_id': '123',
+            'target_catalog_name': 'catalog',
+            'target_schema_name': 'schema',
+            'target_pipeline_name': 'pipeline',
+            'workspace_name': 'workspace',
         }
-    )
+    ],
+}
+
+
+# The state is deep copied as the installation mutates it when saving
+@pytest.fixture()
+def mock_installation() -> MockInstallation:
+    return MockInstallation(copy.deepcopy(_MOCK_INSTALLATION_STATE))
 
 
 class CustomIterator:
@@ -196,8 +199,10 @@ class MockPathLookup(PathLookup):
         self,
         cwd=Path(__file__).parent / "source_code/samples",
         sys_paths: list[Path] | None = None,
+        *,
+        resolve_cache: dict[tuple[Path, Path], Path | None] | None = None,
     ):
-        super().__init__(cwd, sys_paths or [])
+        super().__init__(cwd, sys_paths if sys_paths is not None else [], resolve_cache=resolve_cache)
 
         self.successfully_resolved_paths = set[Path]()  # The paths that were successfully resolved
 
@@ -209,7 +214,7 @@ class MockPathLookup(PathLookup):
         return resolved_path
 
     def change_directory(self, new_working_directory: Path) -> MockPathLookup:
-        path_lookup = MockPathLookup(new_working_directory, self._sys_paths)
+        path_lookup = MockPathLookup(new_working_directory, self._sys_paths, resolve_cache=self._resolve_cache)
         # For testing, we want to keep of the successfully resolved paths after directory changes
         path_lookup.successfully_resolved_paths = self.successfully_resolved_paths
         return path_lookup
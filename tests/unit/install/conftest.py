@@ -1,9 +1,10 @@
 import io
-from unittest.mock import create_autospec
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 import yaml
 from databricks.labs.blueprint.tui import MockPrompts
+from databricks.labs.blueprint.wheels import ProductInfo, WheelsV2
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.compute import ClusterDetails, CreatePolicyResponse, DataSecurityMode, State
 from databricks.sdk.errors import NotFound
@@ -19,12 +20,36 @@ from databricks.sdk.service.sql import (
 )
 from databricks.sdk.service.workspace import ObjectInfo
 
+from databricks.labs.ucx.config import WorkspaceConfig
+from databricks.labs.ucx.runtime import Workflows
 
-@pytest.fixture
-def any_prompt():
+
+@pytest.fixture(scope="session")
+def any_prompt() -> MockPrompts:
+    # Mock prompts are immutable, extending them returns new prompts, so all tests share one instance. Session fixtures
+    # are created within each pytest-xdist worker, thus the instance is never shared across processes.
     return MockPrompts({".*": ""})
 
 
+@pytest.fixture(scope="session")
+def product_info() -> ProductInfo:
+    return ProductInfo.from_class(WorkspaceConfig)
+
+
+@pytest.fixture(scope="session")
+def all_workflows() -> Workflows:
+    # The deployment only reads the workflows, so all tests share one instance
+    return Workflows.all()
+
+
+@pytest.fixture
+def wheels() -> MagicMock:
+    # A mock with a spec is cheaper to create than an autospec, which introspects the signature of every method
+    wheels = MagicMock(spec_set=WheelsV2)
+    wheels.upload_wheel_dependencies.return_value = []
+    return wheels
+
+
 @pytest.fixture
 def clusters() -> list[ClusterDetails]:
     return [
@@ -74,6 +99,7 @@ def ws(clusters):
             return io.BytesIO(state[path].encode('utf-8'))
         return io.StringIO(state[path])
 
+    # Not shared across tests like the prompts: tests replace methods on the mock, which `reset_mock` does not undo
     workspace_client = create_autospec(WorkspaceClient)
 
     workspace_client.current_user.me = lambda: iam.User(
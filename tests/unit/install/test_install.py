@@ -1,6 +1,10 @@
+import copy
+import dataclasses
 import json
 import logging
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import MagicMock, create_autospec, patch
 
@@ -10,7 +14,7 @@ from databricks.labs.blueprint.installation import Installation, MockInstallatio
 from databricks.labs.blueprint.installer import InstallState
 from databricks.labs.blueprint.parallel import ManyError
 from databricks.labs.blueprint.tui import MockPrompts
-from databricks.labs.blueprint.wheels import ProductInfo, WheelsV2
+from databricks.labs.blueprint.wheels import ProductInfo
 from databricks.labs.lsql.backends import MockBackend
 from databricks.sdk import AccountClient, WorkspaceClient
 from databricks.sdk.core import Config
@@ -31,8 +35,6 @@ from databricks.sdk.service.iam import Group, ComplexValue
 from databricks.sdk.service.jobs import BaseRun, RunLifeCycleState, RunResultState, RunState
 from databricks.sdk.service.provisioning import Workspace
 
-import databricks.labs.ucx.installer.mixins
-import databricks.labs.ucx.uninstall  # noqa
 from databricks.labs.ucx.config import WorkspaceConfig
 from databricks.labs.ucx.contexts.workflow_task import RuntimeContext
 from databricks.labs.ucx.framework.tasks import Workflow, job_task
@@ -40,75 +42,213 @@ from databricks.labs.ucx.install import AccountInstaller, WorkspaceInstallation,
 from databricks.labs.ucx.installer.workflows import DeployedWorkflows, WorkflowsDeployment
 from databricks.labs.ucx.runtime import Workflows
 
-PRODUCT_INFO = ProductInfo.from_class(WorkspaceConfig)
 
-
-def created_job(workspace_client, name):
+def created_jobs_by_name(workspace_client: MagicMock) -> dict[str, dict[str, Any]]:
+    created_jobs: dict[str, dict[str, Any]] = {}
     for call in workspace_client.jobs.method_calls:
-        if call.kwargs['name'] == name:
-            return call.kwargs
-    raise AssertionError(f'call not found: {name}')
+        if 'name' in call.kwargs:
+            created_jobs.setdefault(call.kwargs['name'], call.kwargs)
+    return created_jobs
+
 
+def created_job(created_jobs: dict[str, dict[str, Any]], name: str) -> dict[str, Any]:
+    if name not in created_jobs:
+        raise AssertionError(f'call not found: {name}')
+    return created_jobs[name]
 
-def created_job_tasks(workspace_client: MagicMock, name: str) -> dict[str, jobs.Task]:
-    call = created_job(workspace_client, name)
+
+def created_job_tasks(created_jobs: dict[str, dict[str, Any]], name: str) -> dict[str, jobs.Task]:
+    call = created_job(created_jobs, name)
     return {_.task_key: _ for _ in call['tasks']}
 
 
+# The configuration written when the installer prompts are answered with their defaults
+_DEFAULT_WS_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "version": 2,
+        "default_catalog": "ucx_default",
+        "ucx_catalog": "ucx",
+        "inventory_database": "ucx",
+        "log_level": "INFO",
+        "num_threads": 8,
+        "min_workers": 1,
+        "max_workers": 10,
+        "policy_id": "foo",
+        "renamed_group_prefix": "db-temp-",
+        "warehouse_id": "abc",
+        "workspace_start_path": "/",
+        "num_days_submit_runs_history": 30,
+        "query_statement_disposition": "INLINE",
+        "recon_tolerance_percent": 5,
+        "managed_table_external_storage": "CLONE",
+    }
+)
+
+
+# The answers to the installer prompts shared by the configuration tests
+_BASE_PROMPTS: Mapping[str, str] = MappingProxyType(
+    {
+        r".*PRO or SERVERLESS SQL warehouse.*": "1",
+        r"Choose how to map the workspace groups.*": "2",  # specify names
+        r"If hive_metastore contains managed table with external.*": "1",
+        r".*": "",
+    }
+)
+
+
+# Mock prompts are immutable, so the tests configuring an installation extend these shared answers
+_CONFIGURE_PROMPTS = MockPrompts(
+    {
+        r".*PRO or SERVERLESS SQL warehouse.*": "1",
+        r"Choose how to map the workspace groups.*": "2",
+        r"Open config file in.*": "no",
+        r".*": "",
+    }
+)
+
+
+_CREATE_TABLE_FAIL: Mapping[str, str] = MappingProxyType(
+    {'CREATE TABLE': '[UNRESOLVED_COLUMN.WITH_SUGGESTION] A column, variable is incorrect'}
+)
+
+
+def _assessment_run(result_state: RunResultState | None) -> BaseRun:
+    return BaseRun(
+        job_clusters=None,
+        job_id=677268692725050,
+        job_parameters=None,
+        number_in_job=725118654200173,
+        run_id=725118654200173,
+        run_name="[UCX] assessment",
+        state=RunState(result_state=result_state),
+    )
+
+
+_ONE_SECOND = timedelta(seconds=1)
+_FAILED_ASSESSMENT_RUNS = (_assessment_run(RunResultState.FAILED),)
+_SUCCEEDED_ASSESSMENT_RUNS = (_assessment_run(RunResultState.SUCCESS),)
+_UNFINISHED_ASSESSMENT_RUNS = (_assessment_run(None),)
+
+
+_LATEST_RUN = BaseRun(
+    job_id=123,
+    run_name="assessment",
+    state=RunState(result_state=RunResultState.SUCCESS, life_cycle_state=RunLifeCycleState.TERMINATED),
+    start_time=1704114000000,
+)
+
+
+def _latest_run(**overrides) -> BaseRun:
+    return dataclasses.replace(_LATEST_RUN, **overrides)
+
+
+_STATE = {
+    'state.json': {
+        'resources': {
+            'dashboards': {'assessment_main': 'abc', 'assessment_estimates': 'def', 'migration_main': 'ghi'},
+        }
+    }
+}
+_STATE_WITH_JOBS = {
+    'state.json': {
+        'resources': {
+            'jobs': {"assessment": "123"},
+            'dashboards': {'assessment_main': 'abc', 'assessment_estimates': 'def'},
+        }
+    }
+}
+_STATE_WITH_EXTRA_JOBS = {
+    'state.json': {
+        'resources': {
+            'jobs': {"assessment": "123", "extra_job": "124", "other_job": "125"},
+            'dashboards': {'assessment_main': 'abc', 'assessment_estimates': 'def'},
+        }
+    }
+}
+_EXTRA_JOBS: Mapping[int, jobs.Job] = MappingProxyType(
+    {
+        123: jobs.Job(
+            settings=jobs.JobSettings(
+                tasks=[jobs.Task('x', notebook_task=jobs.NotebookTask(notebook_path='~/mock/assessment'))]
+            )
+        ),
+        124: jobs.Job(
+            settings=jobs.JobSettings(
+                tasks=[jobs.Task('y', python_wheel_task=jobs.PythonWheelTask('databricks_labs_ucx', 'runtime'))]
+            )
+        ),
+        125: jobs.Job(
+            settings=jobs.JobSettings(
+                tasks=[jobs.Task('z', notebook_task=jobs.NotebookTask(notebook_path='outside-of-ucx'))]
+            )
+        ),
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def _capture_warnings(caplog) -> None:
+    caplog.set_level(logging.WARNING)
+
+
+# The states are deep copied as the installation mutates them when saving
 @pytest.fixture
 def mock_installation():
-    return MockInstallation(
-        {
-            'state.json': {
-                'resources': {
-                    'dashboards': {'assessment_main': 'abc', 'assessment_estimates': 'def', 'migration_main': 'ghi'}
-                }
-            }
-        }
-    )
+    return MockInstallation(copy.deepcopy(_STATE))
 
 
 @pytest.fixture
 def mock_installation_with_jobs():
-    return MockInstallation(
-        {
-            'state.json': {
-                'resources': {
-                    'jobs': {"assessment": "123"},
-                    'dashboards': {'assessment_main': 'abc', 'assessment_estimates': 'def'},
-                }
-            }
-        }
-    )
+    return MockInstallation(copy.deepcopy(_STATE_WITH_JOBS))
+
+
+@pytest.fixture
+def install_state(mock_installation):
+    return InstallState.from_installation(mock_installation)
+
+
+@pytest.fixture
+def install_state_with_jobs(mock_installation_with_jobs):
+    return InstallState.from_installation(mock_installation_with_jobs)
+
+
+@pytest.fixture
+def deployed(ws, install_state_with_jobs):
+    return DeployedWorkflows(ws, install_state_with_jobs)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _webbrowser_open() -> Iterator[MagicMock]:
+    # Patched once for the whole module, so that no test opens a browser
+    with patch("webbrowser.open") as open_mock:
+        yield open_mock
+
+
+@pytest.fixture
+def webbrowser_open(_webbrowser_open) -> MagicMock:
+    _webbrowser_open.reset_mock()
+    return _webbrowser_open
 
 
 @pytest.fixture
 def mock_installation_extra_jobs():
-    return MockInstallation(
-        {
-            'state.json': {
-                'resources': {
-                    'jobs': {"assessment": "123", "extra_job": "124", "other_job": "125"},
-                    'dashboards': {'assessment_main': 'abc', 'assessment_estimates': 'def'},
-                }
-            }
-        }
-    )
+    return MockInstallation(copy.deepcopy(_STATE_WITH_EXTRA_JOBS))
 
 
-def test_create_database(ws, caplog, mock_installation, any_prompt) -> None:
-    sql_backend = MockBackend(
-        fails_on_first={'CREATE TABLE': '[UNRESOLVED_COLUMN.WITH_SUGGESTION] A column, variable is incorrect'}
-    )
-    install_state = InstallState.from_installation(mock_installation)
-    wheels = create_autospec(WheelsV2)
+@pytest.fixture
+def install_state_extra_jobs(mock_installation_extra_jobs):
+    return InstallState.from_installation(mock_installation_extra_jobs)
+
+
+def test_create_database(ws, caplog, mock_installation, any_prompt, wheels, product_info, install_state) -> None:
+    sql_backend = MockBackend(fails_on_first=dict(_CREATE_TABLE_FAIL))
     workflows_installation = WorkflowsDeployment(
         WorkspaceConfig(inventory_database="...", policy_id='123'),
         mock_installation,
         install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
+        product_info,
         Workflows([]),
     )
 
@@ -120,7 +260,7 @@ def test_create_database(ws, caplog, mock_installation, any_prompt) -> None:
         ws,
         workflows_installation,
         any_prompt,
-        PRODUCT_INFO,
+        product_info,
     )
 
     with pytest.raises(BadRequest) as failure:
@@ -134,43 +274,43 @@ def test_create_database(ws, caplog, mock_installation, any_prompt) -> None:
     wheels.upload_to_wsfs.assert_called()
 
 
-def test_install_cluster_override_jobs(ws, mock_installation) -> None:
-    wheels = create_autospec(WheelsV2)
+def test_install_cluster_override_jobs(
+    ws, mock_installation, wheels, product_info, all_workflows, install_state
+) -> None:
     workflows_installation = WorkflowsDeployment(
         WorkspaceConfig(inventory_database='ucx', override_clusters={"main": 'one', "tacl": 'two'}, policy_id='123'),
         mock_installation,
-        InstallState.from_installation(mock_installation),
+        install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
-        Workflows.all(),
+        product_info,
+        all_workflows,
     )
 
     workflows_installation.create_jobs()
 
-    tasks = created_job_tasks(ws, '[MOCK] assessment')
+    tasks = created_job_tasks(created_jobs_by_name(ws), '[MOCK] assessment')
     assert tasks['assess_jobs'].existing_cluster_id == 'one'
     assert tasks['crawl_grants'].existing_cluster_id == 'two'
     wheels.upload_to_wsfs.assert_called_once()
     wheels.upload_to_dbfs.assert_not_called()
 
 
-def test_writeable_dbfs(ws, tmp_path, mock_installation) -> None:
+def test_writeable_dbfs(ws, tmp_path, mock_installation, wheels, product_info, all_workflows, install_state) -> None:
     """Ensure configure does not add cluster override for happy path of writable DBFS"""
-    wheels = create_autospec(WheelsV2)
     workflows_installation = WorkflowsDeployment(
         WorkspaceConfig(inventory_database='ucx', policy_id='123'),
         mock_installation,
-        InstallState.from_installation(mock_installation),
+        install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
-        Workflows.all(),
+        product_info,
+        all_workflows,
     )
 
     workflows_installation.create_jobs()
 
-    job = created_job(ws, '[MOCK] assessment')
+    job = created_job(created_jobs_by_name(ws), '[MOCK] assessment')
     job_clusters = {_.job_cluster_key: _ for _ in job['job_clusters']}
     assert 'main' in job_clusters
     assert 'tacl' in job_clusters
@@ -179,108 +319,43 @@ def test_writeable_dbfs(ws, tmp_path, mock_installation) -> None:
     wheels.upload_to_wsfs.assert_called_once()
 
 
-def test_run_workflow_creates_proper_failure(ws, mocker, mock_installation_with_jobs):
-    def run_now(job_id):
-        assert job_id == 123
-
-        def result():
-            raise OperationFailed(...)
-
-        waiter = mocker.Mock()
-        waiter.result = result
-        waiter.run_id = "qux"
-        return waiter
+_FAILED_TASK = jobs.RunTask(task_key="stuff", state=jobs.RunState(result_state=jobs.RunResultState.FAILED), run_id=123)
 
-    ws.jobs.run_now = run_now
-    ws.jobs.get_run.return_value = jobs.Run(
-        state=jobs.RunState(state_message="Stuff happens."),
-        tasks=[
-            jobs.RunTask(
-                task_key="stuff",
-                state=jobs.RunState(result_state=jobs.RunResultState.FAILED),
-                run_id=123,
-            )
-        ],
-    )
-    ws.jobs.get_run_output.return_value = jobs.RunOutput(error="does not compute", error_trace="# goes to stderr")
-    ws.jobs.wait_get_run_job_terminated_or_skipped.side_effect = OperationFailed("does not compute")
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    installer = DeployedWorkflows(ws, install_state)
-    logger = logging.getLogger("databricks.labs.ucx.installer.workflows")
-    logger.setLevel(logging.DEBUG)
-    with pytest.raises(Unknown) as failure:
-        installer.run_workflow("assessment")
 
-    assert str(failure.value) == "stuff: does not compute"
-
-
-def test_run_workflow_run_id_not_found(ws, mocker, mock_installation_with_jobs):
-    def run_now(job_id):
-        assert job_id == 123
-
-        def result():
-            raise OperationFailed(...)
-
-        waiter = mocker.Mock()
-        waiter.result = result
-        waiter.run_id = None
-        return waiter
-
-    ws.jobs.run_now = run_now
-    ws.jobs.get_run.return_value = jobs.Run(
-        state=jobs.RunState(state_message="Stuff happens."),
-        tasks=[
-            jobs.RunTask(
-                task_key="stuff",
-                state=jobs.RunState(result_state=jobs.RunResultState.FAILED),
-                run_id=123,
-            )
-        ],
-    )
-    ws.jobs.get_run_output.return_value = jobs.RunOutput(error="does not compute", error_trace="# goes to stderr")
-    ws.jobs.wait_get_run_job_terminated_or_skipped.side_effect = OperationFailed("does not compute")
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-    with pytest.raises(NotFound):
-        deployed.run_workflow("assessment")
-
-
-def test_run_workflow_creates_failure_from_mapping(ws, mocker, mock_installation, mock_installation_with_jobs):
-    def run_now(job_id):
-        assert job_id == 123
-
-        def result():
-            raise OperationFailed(...)
-
-        waiter = mocker.Mock()
-        waiter.result = result
-        waiter.run_id = "qux"
-        return waiter
-
-    ws.jobs.run_now = run_now
-    ws.jobs.get_run.return_value = jobs.Run(
-        state=jobs.RunState(state_message="Stuff happens."),
-        tasks=[
-            jobs.RunTask(
-                task_key="stuff",
-                state=jobs.RunState(result_state=jobs.RunResultState.FAILED),
-                run_id=123,
-            )
-        ],
-    )
-    ws.jobs.wait_get_run_job_terminated_or_skipped.side_effect = OperationFailed("does not compute")
-    ws.jobs.get_run_output.return_value = jobs.RunOutput(
-        error="something: PermissionDenied: does not compute", error_trace="# goes to stderr"
-    )
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-    with pytest.raises(PermissionDenied) as failure:
-        deployed.run_workflow("assessment")
-
-    assert str(failure.value) == "does not compute"
-
-
-def test_run_workflow_creates_failure_many_error(ws, mocker, mock_installation_with_jobs):
+@pytest.mark.parametrize(
+    "run_id,tasks,error,expected_exception,expected_message",
+    [
+        ("qux", [_FAILED_TASK], "does not compute", Unknown, "stuff: does not compute"),
+        (None, [_FAILED_TASK], "does not compute", NotFound, None),
+        ("qux", [_FAILED_TASK], "something: PermissionDenied: does not compute", PermissionDenied, "does not compute"),
+        (
+            "qux",
+            [
+                _FAILED_TASK,
+                jobs.RunTask(
+                    task_key="things",
+                    state=jobs.RunState(result_state=jobs.RunResultState.TIMEDOUT),
+                    run_id=124,
+                ),
+                jobs.RunTask(
+                    task_key="some",
+                    state=jobs.RunState(result_state=jobs.RunResultState.FAILED),
+                    run_id=125,
+                ),
+            ],
+            "something: DataLoss: does not compute",
+            ManyError,
+            (
+                "Detected 3 failures: "
+                "DataLoss: does not compute, "
+                "DeadlineExceeded: things: The run was stopped after reaching the timeout"
+            ),
+        ),
+    ],
+)
+def test_run_workflow_creates_proper_failure(
+    ws, mocker, deployed, run_id, tasks, error, expected_exception, expected_message
+) -> None:
     def run_now(job_id):
         assert job_id == 123
 
@@ -289,44 +364,18 @@ def test_run_workflow_creates_failure_many_error(ws, mocker, mock_installation_w
 
         waiter = mocker.Mock()
         waiter.result = result
-        waiter.run_id = "qux"
+        waiter.run_id = run_id
         return waiter
 
     ws.jobs.run_now = run_now
-    ws.jobs.get_run.return_value = jobs.Run(
-        state=jobs.RunState(state_message="Stuff happens."),
-        tasks=[
-            jobs.RunTask(
-                task_key="stuff",
-                state=jobs.RunState(result_state=jobs.RunResultState.FAILED),
-                run_id=123,
-            ),
-            jobs.RunTask(
-                task_key="things",
-                state=jobs.RunState(result_state=jobs.RunResultState.TIMEDOUT),
-                run_id=124,
-            ),
-            jobs.RunTask(
-                task_key="some",
-                state=jobs.RunState(result_state=jobs.RunResultState.FAILED),
-                run_id=125,
-            ),
-        ],
-    )
-    ws.jobs.get_run_output.return_value = jobs.RunOutput(
-        error="something: DataLoss: does not compute", error_trace="# goes to stderr"
-    )
+    ws.jobs.get_run.return_value = jobs.Run(state=jobs.RunState(state_message="Stuff happens."), tasks=tasks)
+    ws.jobs.get_run_output.return_value = jobs.RunOutput(error=error, error_trace="# goes to stderr")
     ws.jobs.wait_get_run_job_terminated_or_skipped.side_effect = OperationFailed("does not compute")
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-    with pytest.raises(ManyError) as failure:
+    with pytest.raises(expected_exception) as failure:
         deployed.run_workflow("assessment")
 
-    assert str(failure.value) == (
-        "Detected 3 failures: "
-        "DataLoss: does not compute, "
-        "DeadlineExceeded: things: The run was stopped after reaching the timeout"
-    )
+    if expected_message is not None:
+        assert str(failure.value) == expected_message
 
 
 @pytest.mark.parametrize(
@@ -357,85 +406,40 @@ def test_configure_sets_expected_workspace_configuration_values(
     prompt_question,
     prompt_answer,
     workspace_config_overwrite,
+    product_info,
 ) -> None:
-    workspace_config_default = {
-        "version": 2,
-        "default_catalog": "ucx_default",
-        "ucx_catalog": "ucx",
-        "inventory_database": "ucx",
-        "log_level": "INFO",
-        "num_threads": 8,
-        "min_workers": 1,
-        "max_workers": 10,
-        "policy_id": "foo",
-        "renamed_group_prefix": "db-temp-",
-        "warehouse_id": "abc",
-        "workspace_start_path": "/",
-        "num_days_submit_runs_history": 30,
-        'query_statement_disposition': 'INLINE',
-        "recon_tolerance_percent": 5,
-        "managed_table_external_storage": "CLONE",
-    }
-    prompts = MockPrompts(
-        {
-            r".*PRO or SERVERLESS SQL warehouse.*": "1",
-            r"Choose how to map the workspace groups.*": "2",  # specify names
-            r"If hive_metastore contains managed table with external.*": "1",
-            r".*": "",
-            prompt_question: prompt_answer,
-        }
-    )
-    install = WorkspaceInstaller(ws).replace(prompts=prompts, installation=mock_installation, product_info=PRODUCT_INFO)
+    prompts = MockPrompts({**_BASE_PROMPTS, prompt_question: prompt_answer})
+    install = WorkspaceInstaller(ws).replace(prompts=prompts, installation=mock_installation, product_info=product_info)
 
     install.configure()
 
-    workspace_config_expected = {**workspace_config_default, **workspace_config_overwrite}
+    workspace_config_expected = {**_DEFAULT_WS_CONFIG, **workspace_config_overwrite}
     mock_installation.assert_file_written("config.yml", workspace_config_expected)
 
 
 def test_configure_with_default_owner_group(
     ws,
     mock_installation,
+    product_info,
 ) -> None:
-    workspace_config_expected = {
-        "version": 2,
-        "default_catalog": "ucx_default",
-        "default_owner_group": "account_group",
-        "ucx_catalog": "ucx",
-        "inventory_database": "ucx",
-        "log_level": "INFO",
-        "num_threads": 8,
-        "min_workers": 1,
-        "max_workers": 10,
-        "policy_id": "foo",
-        "query_statement_disposition": "INLINE",
-        "renamed_group_prefix": "db-temp-",
-        "warehouse_id": "abc",
-        "workspace_start_path": "/",
-        "num_days_submit_runs_history": 30,
-        "recon_tolerance_percent": 5,
-        "managed_table_external_storage": "CLONE",
-    }
+    workspace_config_expected = {**_DEFAULT_WS_CONFIG, "default_owner_group": "account_group"}
     prompts = MockPrompts(
         {
-            r".*PRO or SERVERLESS SQL warehouse.*": "1",
-            r"Choose how to map the workspace groups.*": "2",  # specify names
-            r"If hive_metastore contains managed table with external.*": "1",
+            **_BASE_PROMPTS,
             r"Do you want to define a default owner group.*": "yes",
             r"Select the group to be used.*": "0",
-            r".*": "",
         }
     )
     group1 = Group(id="1", display_name="account_group", members=[ComplexValue(display="me@example.com", value="666")])
     ws.api_client.do.return_value = {"Resources": [group1.as_dict()]}
-    install = WorkspaceInstaller(ws).replace(prompts=prompts, installation=mock_installation, product_info=PRODUCT_INFO)
+    install = WorkspaceInstaller(ws).replace(prompts=prompts, installation=mock_installation, product_info=product_info)
 
     install.configure()
 
     mock_installation.assert_file_written("config.yml", workspace_config_expected)
 
 
-def test_corrupted_config(ws, mock_installation, caplog):
+def test_corrupted_config(ws, mock_installation, caplog, product_info):
     installation = MockInstallation({'config.yml': "corrupted"})
 
     prompts = MockPrompts(
@@ -450,15 +454,14 @@ def test_corrupted_config(ws, mock_installation, caplog):
     install = WorkspaceInstaller(ws).replace(
         prompts=prompts,
         installation=installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
     )
-    with caplog.at_level('WARNING'):
-        install.configure()
+    install.configure()
 
     assert 'Existing installation at ~/mock is corrupted' in caplog.text
 
 
-def test_create_cluster_policy(ws, mock_installation) -> None:
+def test_create_cluster_policy(ws, mock_installation, product_info) -> None:
     ws.cluster_policies.list.return_value = [
         Policy(
             policy_id="foo1",
@@ -469,48 +472,28 @@ def test_create_cluster_policy(ws, mock_installation) -> None:
     ]
     prompts = MockPrompts(
         {
-            r".*PRO or SERVERLESS SQL warehouse.*": "1",
-            r"Choose how to map the workspace groups.*": "2",  # specify names
+            **_BASE_PROMPTS,
             r".*workspace group names.*": "g1, g2, g99",
             r".*We have identified one or more cluster.*": "No",
             r".*Choose a cluster policy.*": "0",
             r"Reconciliation threshold, in percentage.*": "5",
-            r"If hive_metastore contains managed table with external.*": "1",
-            r".*": "",
         }
     )
     install = WorkspaceInstaller(ws).replace(
         prompts=prompts,
         installation=mock_installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
     )
     install.configure()
     mock_installation.assert_file_written(
         'config.yml',
-        {
-            'version': 2,
-            'default_catalog': 'ucx_default',
-            'ucx_catalog': 'ucx',
-            'include_group_names': ['g1', 'g2', 'g99'],
-            'inventory_database': 'ucx',
-            'log_level': 'INFO',
-            'num_days_submit_runs_history': 30,
-            'num_threads': 8,
-            'min_workers': 1,
-            'max_workers': 10,
-            'policy_id': 'foo1',
-            'renamed_group_prefix': 'db-temp-',
-            'warehouse_id': 'abc',
-            'workspace_start_path': '/',
-            'query_statement_disposition': 'INLINE',
-            'recon_tolerance_percent': 5,
-            'managed_table_external_storage': "CLONE",
-        },
+        {**_DEFAULT_WS_CONFIG, 'include_group_names': ['g1', 'g2', 'g99'], 'policy_id': 'foo1'},
     )
 
 
-def test_main_with_existing_conf_does_not_recreate_config(ws, mocker, mock_installation) -> None:
-    webbrowser_open = mocker.patch("webbrowser.open")
+def test_main_with_existing_conf_does_not_recreate_config(
+    ws, mock_installation, wheels, webbrowser_open, product_info, install_state
+) -> None:
     sql_backend = MockBackend()
     prompts = MockPrompts(
         {
@@ -519,15 +502,13 @@ def test_main_with_existing_conf_does_not_recreate_config(ws, mocker, mock_insta
             r".*": "",
         }
     )
-    install_state = InstallState.from_installation(mock_installation)
-    wheels = create_autospec(WheelsV2)
     workflows_installer = WorkflowsDeployment(
         WorkspaceConfig(inventory_database="ucx", policy_id='123'),
         mock_installation,
         install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
+        product_info,
         Workflows([]),
     )
     workspace_installation = WorkspaceInstallation(
@@ -538,7 +519,7 @@ def test_main_with_existing_conf_does_not_recreate_config(ws, mocker, mock_insta
         ws,
         workflows_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
     workspace_installation.run()
 
@@ -547,9 +528,8 @@ def test_main_with_existing_conf_does_not_recreate_config(ws, mocker, mock_insta
     wheels.upload_to_dbfs.assert_not_called()
 
 
-def test_remove_database(ws):
+def test_remove_database(ws, product_info):
     sql_backend = MockBackend()
-    ws = create_autospec(WorkspaceClient)
     prompts = MockPrompts(
         {
             r'Do you want to uninstall ucx.*': 'yes',
@@ -558,7 +538,7 @@ def test_remove_database(ws):
     )
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx')
-    workflow_installer = create_autospec(WorkflowsDeployment)
+    workflow_installer = MagicMock(spec_set=["create_jobs", "remove_jobs"])
     workspace_installation = WorkspaceInstallation(
         config,
         installation,
@@ -567,7 +547,7 @@ def test_remove_database(ws):
         ws,
         workflow_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
 
     workspace_installation.uninstall()
@@ -579,9 +559,8 @@ def test_remove_database(ws):
     workflow_installer.create_jobs.assert_not_called()
 
 
-def test_remove_jobs_no_state(ws) -> None:
+def test_remove_jobs_no_state(ws, wheels, product_info) -> None:
     sql_backend = MockBackend()
-    ws = create_autospec(WorkspaceClient)
     prompts = MockPrompts(
         {
             r'Do you want to uninstall ucx.*': 'yes',
@@ -591,18 +570,17 @@ def test_remove_jobs_no_state(ws) -> None:
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx')
     install_state = InstallState.from_installation(installation)
-    wheels = create_autospec(WheelsV2)
     workflows_installer = WorkflowsDeployment(
         config,
         installation,
         install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
+        product_info,
         Workflows([]),
     )
     workspace_installation = WorkspaceInstallation(
-        config, installation, install_state, sql_backend, ws, workflows_installer, prompts, PRODUCT_INFO
+        config, installation, install_state, sql_backend, ws, workflows_installer, prompts, product_info
     )
 
     workspace_installation.uninstall()
@@ -612,7 +590,7 @@ def test_remove_jobs_no_state(ws) -> None:
     wheels.upload_to_wsfs.assert_not_called()
 
 
-def test_remove_jobs_with_state_missing_job(ws, caplog, mock_installation_with_jobs) -> None:
+def test_remove_jobs_with_state_missing_job(ws, caplog, mock_installation_with_jobs, wheels, product_info) -> None:
     ws.jobs.delete.side_effect = InvalidParameterValue("job id 123 not found")
 
     sql_backend = MockBackend()
@@ -625,30 +603,35 @@ def test_remove_jobs_with_state_missing_job(ws, caplog, mock_installation_with_j
     config = WorkspaceConfig(inventory_database='ucx')
     installation = mock_installation_with_jobs
     install_state = InstallState.from_installation(installation)
-    wheels = create_autospec(WheelsV2)
     workflows_installer = WorkflowsDeployment(
         config,
         installation,
         install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
+        product_info,
         Workflows([]),
     )
     workspace_installation = WorkspaceInstallation(
-        config, mock_installation_with_jobs, install_state, sql_backend, ws, workflows_installer, prompts, PRODUCT_INFO
+        config,
+        mock_installation_with_jobs,
+        install_state,
+        sql_backend,
+        ws,
+        workflows_installer,
+        prompts,
+        product_info,
     )
 
-    with caplog.at_level('WARNING'):
-        workspace_installation.uninstall()
-        failure = 'Corrupt installation state. Skipping job_id=123 as it is not managed by UCX'
-        assert failure in caplog.messages
+    workspace_installation.uninstall()
+    failure = 'Corrupt installation state. Skipping job_id=123 as it is not managed by UCX'
+    assert failure in caplog.messages
 
     mock_installation_with_jobs.assert_removed()
     wheels.upload_to_wsfs.assert_not_called()
 
 
-def test_remove_warehouse(ws):
+def test_remove_warehouse(ws, product_info):
     ws.warehouses.get.return_value = sql.GetWarehouseResponse(id="123", name="Unity Catalog Migration 123456")
 
     sql_backend = MockBackend()
@@ -660,7 +643,7 @@ def test_remove_warehouse(ws):
     )
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx', warehouse_id="123")
-    workflows_installer = create_autospec(WorkflowsDeployment)
+    workflows_installer = MagicMock(spec_set=["create_jobs", "remove_jobs"])
     workspace_installation = WorkspaceInstallation(
         config,
         installation,
@@ -669,7 +652,7 @@ def test_remove_warehouse(ws):
         ws,
         workflows_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
 
     workspace_installation.uninstall()
@@ -679,7 +662,7 @@ def test_remove_warehouse(ws):
     workflows_installer.create_jobs.assert_not_called()
 
 
-def test_not_remove_warehouse_with_a_different_prefix(ws):
+def test_not_remove_warehouse_with_a_different_prefix(ws, product_info):
     ws.warehouses.get.return_value = sql.GetWarehouseResponse(id="123", name="Starter Endpoint")
 
     sql_backend = MockBackend()
@@ -691,7 +674,7 @@ def test_not_remove_warehouse_with_a_different_prefix(ws):
     )
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx', warehouse_id="123")
-    workflows_installer = create_autospec(WorkflowsDeployment)
+    workflows_installer = MagicMock(spec_set=["create_jobs", "remove_jobs"])
     workspace_installation = WorkspaceInstallation(
         config,
         installation,
@@ -700,7 +683,7 @@ def test_not_remove_warehouse_with_a_different_prefix(ws):
         ws,
         workflows_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
 
     workspace_installation.uninstall()
@@ -710,7 +693,7 @@ def test_not_remove_warehouse_with_a_different_prefix(ws):
     installation.assert_removed()
 
 
-def test_remove_secret_scope(ws, caplog):
+def test_remove_secret_scope(ws, caplog, product_info):
     prompts = MockPrompts(
         {
             r'Do you want to uninstall ucx.*': 'yes',
@@ -719,7 +702,7 @@ def test_remove_secret_scope(ws, caplog):
     )
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx', uber_spn_id="123")
-    workflows_installer = create_autospec(WorkflowsDeployment)
+    workflows_installer = MagicMock(spec_set=["create_jobs", "remove_jobs"])
     workspace_installation = WorkspaceInstallation(
         config,
         installation,
@@ -728,14 +711,14 @@ def test_remove_secret_scope(ws, caplog):
         ws,
         workflows_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
     workspace_installation.uninstall()
     ws.secrets.delete_scope.assert_called_with('ucx')
     workflows_installer.create_jobs.assert_not_called()
 
 
-def test_remove_secret_scope_no_scope(ws, caplog):
+def test_remove_secret_scope_no_scope(ws, caplog, product_info):
     prompts = MockPrompts(
         {
             r'Do you want to uninstall ucx.*': 'yes',
@@ -744,7 +727,7 @@ def test_remove_secret_scope_no_scope(ws, caplog):
     )
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx', uber_spn_id="123")
-    workflows_installer = create_autospec(WorkflowsDeployment)
+    workflows_installer = MagicMock(spec_set=["create_jobs", "remove_jobs"])
     ws.secrets.delete_scope.side_effect = NotFound()
     workspace_installation = WorkspaceInstallation(
         config,
@@ -754,17 +737,16 @@ def test_remove_secret_scope_no_scope(ws, caplog):
         ws,
         workflows_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
-    with caplog.at_level('ERROR'):
-        workspace_installation.uninstall()
-        assert 'Secret scope already deleted' in caplog.messages
+    workspace_installation.uninstall()
+    assert 'Secret scope already deleted' in caplog.messages
 
     ws.secrets.delete_scope.assert_called_with('ucx')
     workflows_installer.create_jobs.assert_not_called()
 
 
-def test_remove_cluster_policy_not_exists(ws, caplog):
+def test_remove_cluster_policy_not_exists(ws, caplog, product_info):
     sql_backend = MockBackend()
     prompts = MockPrompts(
         {
@@ -775,7 +757,7 @@ def test_remove_cluster_policy_not_exists(ws, caplog):
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx')
     ws.cluster_policies.delete.side_effect = NotFound()
-    workflows_installer = create_autospec(WorkflowsDeployment)
+    workflows_installer = MagicMock(spec_set=["create_jobs", "remove_jobs"])
     workspace_installation = WorkspaceInstallation(
         config,
         installation,
@@ -784,18 +766,17 @@ def test_remove_cluster_policy_not_exists(ws, caplog):
         ws,
         workflows_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
 
-    with caplog.at_level('ERROR'):
-        workspace_installation.uninstall()
-        assert 'UCX Policy already deleted' in caplog.messages
+    workspace_installation.uninstall()
+    assert 'UCX Policy already deleted' in caplog.messages
 
     installation.assert_removed()
     workflows_installer.create_jobs.assert_not_called()
 
 
-def test_remove_warehouse_not_exists(ws, caplog):
+def test_remove_warehouse_not_exists(ws, caplog, product_info):
     ws.warehouses.delete.side_effect = InvalidParameterValue("warehouse id 123 not found")
 
     sql_backend = MockBackend()
@@ -807,7 +788,7 @@ def test_remove_warehouse_not_exists(ws, caplog):
     )
     installation = MockInstallation()
     config = WorkspaceConfig(inventory_database='ucx')
-    workflows_installer = create_autospec(WorkflowsDeployment)
+    workflows_installer = MagicMock(spec_set=["create_jobs", "remove_jobs"])
     workspace_installation = WorkspaceInstallation(
         config,
         installation,
@@ -816,186 +797,67 @@ def test_remove_warehouse_not_exists(ws, caplog):
         ws,
         workflows_installer,
         prompts,
-        PRODUCT_INFO,
+        product_info,
     )
 
-    with caplog.at_level('ERROR'):
-        workspace_installation.uninstall()
-        assert 'Error accessing warehouse details' in caplog.messages
+    workspace_installation.uninstall()
+    assert 'Error accessing warehouse details' in caplog.messages
 
     installation.assert_removed()
     workflows_installer.create_jobs.assert_not_called()
 
 
-def test_repair_run(ws, mocker, mock_installation_with_jobs):
-    mocker.patch("webbrowser.open")
-    base = [
-        BaseRun(
-            job_clusters=None,
-            job_id=677268692725050,
-            job_parameters=None,
-            number_in_job=725118654200173,
-            run_id=725118654200173,
-            run_name="[UCX] assessment",
-            state=RunState(result_state=RunResultState.FAILED),
-        )
-    ]
-    ws.jobs.list_runs.return_value = base
-    ws.jobs.list_runs.repair_run = None
-
-    timeout = timedelta(seconds=1)
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-
-    deployed.repair_run("assessment", timeout)
-
-
-def test_repair_run_success(ws, caplog, mock_installation_with_jobs):
-    base = [
-        BaseRun(
-            job_clusters=None,
-            job_id=677268692725050,
-            job_parameters=None,
-            number_in_job=725118654200173,
-            run_id=725118654200173,
-            run_name="[UCX] assessment",
-            state=RunState(result_state=RunResultState.SUCCESS),
-        )
-    ]
-    ws.jobs.list_runs.return_value = base
-    ws.jobs.list_runs.repair_run = None
-    timeout = timedelta(seconds=1)
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-
-    deployed.repair_run("assessment", timeout)
-
-    assert "job is not in FAILED state" in caplog.text
-
-
-def test_repair_run_no_job_id(ws, mock_installation, caplog):
-    base = [
-        BaseRun(
-            job_clusters=None,
-            job_id=677268692725050,
-            job_parameters=None,
-            number_in_job=725118654200173,
-            run_id=725118654200173,
-            run_name="[UCX] assessment",
-            state=RunState(result_state=RunResultState.SUCCESS),
-        )
-    ]
-    ws.jobs.list_runs.return_value = base
-    ws.jobs.list_runs.repair_run = None
-
-    timeout = timedelta(seconds=1)
-    install_state = InstallState.from_installation(mock_installation)
-    deployed = DeployedWorkflows(ws, install_state)
-
-    with caplog.at_level('WARNING'):
-        deployed.repair_run("assessment", timeout)
-        assert 'Skipping assessment: job does not exists hence skipping repair' in caplog.messages
-
-
-def test_repair_run_no_job_run(ws, mock_installation_with_jobs, caplog):
-    ws.jobs.list_runs.return_value = ""
+def test_repair_run(ws, deployed):
+    ws.jobs.list_runs.return_value = _FAILED_ASSESSMENT_RUNS
     ws.jobs.list_runs.repair_run = None
 
-    timeout = timedelta(seconds=1)
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-
-    with caplog.at_level('WARNING'):
-        deployed.repair_run("assessment", timeout)
-        assert "Skipping assessment: job is not initialized yet. Can't trigger repair run now" in caplog.messages
-
-
-def test_repair_run_exception(ws, mock_installation_with_jobs, caplog):
-    ws.jobs.list_runs.side_effect = InvalidParameterValue("Workflow does not exists")
-
-    timeout = timedelta(seconds=1)
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-
-    with caplog.at_level('WARNING'):
-        deployed.repair_run("assessment", timeout)
-        assert "Skipping assessment: Workflow does not exists" in caplog.messages
+    deployed.repair_run("assessment", _ONE_SECOND)
 
 
-def test_repair_run_result_state(ws, caplog, mock_installation_with_jobs):
-    base = [
-        BaseRun(
-            job_clusters=None,
-            job_id=677268692725050,
-            job_parameters=None,
-            number_in_job=725118654200173,
-            run_id=725118654200173,
-            run_name="[UCX] assessment",
-            state=RunState(result_state=None),
-        )
-    ]
-    ws.jobs.list_runs.return_value = base
+def test_repair_run_no_job_id(ws, caplog, install_state):
+    ws.jobs.list_runs.return_value = _SUCCEEDED_ASSESSMENT_RUNS
     ws.jobs.list_runs.repair_run = None
 
-    timeout = timedelta(seconds=1)
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
     deployed = DeployedWorkflows(ws, install_state)
 
-    deployed.repair_run("assessment", timeout)
-    assert "Please try after sometime" in caplog.text
+    deployed.repair_run("assessment", _ONE_SECOND)
+    assert 'Skipping assessment: job does not exists hence skipping repair' in caplog.messages
 
 
 @pytest.mark.parametrize(
-    "state,expected",
+    "list_runs,expected_message",
     [
-        (
-            RunState(
-                result_state=None,
-                life_cycle_state=RunLifeCycleState.RUNNING,
-            ),
-            "RUNNING",
-        ),
-        (
-            RunState(
-                result_state=RunResultState.SUCCESS,
-                life_cycle_state=RunLifeCycleState.TERMINATED,
-            ),
-            "SUCCESS",
-        ),
-        (
-            RunState(
-                result_state=RunResultState.FAILED,
-                life_cycle_state=RunLifeCycleState.TERMINATED,
-            ),
-            "FAILED",
-        ),
-        (
-            RunState(
-                result_state=None,
-                life_cycle_state=None,
-            ),
-            "UNKNOWN",
-        ),
+        (_SUCCEEDED_ASSESSMENT_RUNS, "job is not in FAILED state"),
+        ("", "Skipping assessment: job is not initialized yet. Can't trigger repair run now"),
+        (InvalidParameterValue("Workflow does not exists"), "Skipping assessment: Workflow does not exists"),
+        (_UNFINISHED_ASSESSMENT_RUNS, "Please try after sometime"),
     ],
 )
-def test_latest_job_status_states(ws, mock_installation_with_jobs, state, expected):
-    base = [
-        BaseRun(
-            job_id=123,
-            run_name="assessment",
-            state=state,
-            start_time=1704114000000,
-        )
+def test_repair_run_skips(ws, caplog, deployed, list_runs, expected_message) -> None:
+    if isinstance(list_runs, Exception):
+        ws.jobs.list_runs.side_effect = list_runs
+    else:
+        ws.jobs.list_runs.return_value = list_runs
+
+    deployed.repair_run("assessment", _ONE_SECOND)
+
+    assert expected_message in caplog.text
+
+
+def test_latest_job_status_states(ws, deployed) -> None:
+    states_and_expected = [
+        (RunState(result_state=None, life_cycle_state=RunLifeCycleState.RUNNING), "RUNNING"),
+        (RunState(result_state=RunResultState.SUCCESS, life_cycle_state=RunLifeCycleState.TERMINATED), "SUCCESS"),
+        (RunState(result_state=RunResultState.FAILED, life_cycle_state=RunLifeCycleState.TERMINATED), "FAILED"),
+        (RunState(result_state=None, life_cycle_state=None), "UNKNOWN"),
     ]
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-    ws.jobs.list_runs.return_value = base
-    status = deployed.latest_job_status()
-    assert len(status) == 1
-    assert status[0]["state"] == expected
+    for state, expected in states_and_expected:
+        ws.jobs.list_runs.return_value = [_latest_run(state=state)]
+        status = deployed.latest_job_status()
+        assert len(status) == 1
+        assert status[0]["state"] == expected, f"unexpected state for {state}"
 
 
-@patch(f"{databricks.labs.ucx.installer.workflows.__name__}.datetime", wraps=datetime)
 @pytest.mark.parametrize(
     "start_time,expected",
     [
@@ -1005,57 +867,30 @@ def test_latest_job_status_states(ws, mock_installation_with_jobs, state, expect
         (None, "<never run>"),
     ],
 )
-def test_latest_job_status_success_with_time(mock_datetime, ws, mock_installation_with_jobs, start_time, expected):
-    base = [
-        BaseRun(
-            job_id=123,
-            run_name="assessment",
-            state=RunState(
-                result_state=RunResultState.SUCCESS,
-                life_cycle_state=RunLifeCycleState.TERMINATED,
-            ),
-            start_time=start_time,
-        )
-    ]
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
-    ws.jobs.list_runs.return_value = base
-    faked_now = datetime(2024, 1, 1, 14, 0, 0)
-    mock_datetime.now.return_value = faked_now
+def test_latest_job_status_success_with_time(ws, install_state_with_jobs, start_time, expected):
+    ws.jobs.list_runs.return_value = [_latest_run(start_time=start_time)]
+    deployed = DeployedWorkflows(ws, install_state_with_jobs, now=lambda: datetime(2024, 1, 1, 14, 0, 0))
     status = deployed.latest_job_status()
     assert status[0]["started"] == expected
 
 
 def test_latest_job_status_list(ws):
-    runs = [
-        [
-            BaseRun(
+    runs_by_job_id = {
+        1: [
+            _latest_run(
                 job_id=1,
                 run_name="job1",
-                state=RunState(
-                    result_state=None,
-                    life_cycle_state=RunLifeCycleState.RUNNING,
-                ),
-                start_time=1705577671907,
-            )
-        ],
-        [
-            BaseRun(
-                job_id=2,
-                run_name="job2",
-                state=RunState(
-                    result_state=RunResultState.SUCCESS,
-                    life_cycle_state=RunLifeCycleState.TERMINATED,
-                ),
+                state=RunState(result_state=None, life_cycle_state=RunLifeCycleState.RUNNING),
                 start_time=1705577671907,
             )
         ],
-        [],  # the last job has no runs
-    ]
+        2: [_latest_run(job_id=2, run_name="job2", start_time=1705577671907)],
+        # the last job has no runs
+    }
     installation = MockInstallation({'state.json': {'resources': {'jobs': {"job1": "1", "job2": "2", "job3": "3"}}}})
     install_state = InstallState.from_installation(installation)
     deployed = DeployedWorkflows(ws, install_state)
-    ws.jobs.list_runs.side_effect = iter(runs)
+    ws.jobs.list_runs.side_effect = lambda job_id, **_: runs_by_job_id.get(job_id, [])
     status = deployed.latest_job_status()
     assert len(status) == 3
     assert status[0]["step"] == "job1"
@@ -1066,49 +901,40 @@ def test_latest_job_status_list(ws):
     assert status[2]["state"] == "UNKNOWN"
 
 
-def test_latest_job_status_no_job_run(ws, mock_installation_with_jobs):
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
+def test_latest_job_status_no_job_run(ws, deployed):
     ws.jobs.list_runs.return_value = ""
     status = deployed.latest_job_status()
     assert len(status) == 1
     assert status[0]["step"] == "assessment"
 
 
-def test_latest_job_status_exception(ws, mock_installation_with_jobs):
-    install_state = InstallState.from_installation(mock_installation_with_jobs)
-    deployed = DeployedWorkflows(ws, install_state)
+def test_latest_job_status_exception(ws, deployed):
     ws.jobs.list_runs.side_effect = InvalidParameterValue("Workflow does not exists")
     status = deployed.latest_job_status()
     assert len(status) == 0
 
 
-def test_open_config(ws, mocker, mock_installation):
-    webbrowser_open = mocker.patch("webbrowser.open")
-    prompts = MockPrompts(
+def test_open_config(ws, mock_installation, webbrowser_open, product_info):
+    prompts = _CONFIGURE_PROMPTS.extend(
         {
-            r".*PRO or SERVERLESS SQL warehouse.*": "1",
-            r"Choose how to map the workspace groups.*": "2",
             r".*workspace group names.*": "g1, g2, g99",
             r"Open config file in.*": "yes",
             r"If hive_metastore contains managed table with external.*": "0",
-            r".*": "",
         }
     )
 
     install = WorkspaceInstaller(ws).replace(
         prompts=prompts,
         installation=mock_installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
     )
     install.configure()
 
     webbrowser_open.assert_called_with('https://localhost/#workspace~/mock/config.yml')
 
 
-def test_triggering_assessment_wf(ws, mocker, mock_installation) -> None:
+def test_triggering_assessment_wf(ws, mocker, mock_installation, wheels, product_info, all_workflows) -> None:
     ws.jobs.run_now = mocker.Mock()
-    mocker.patch("webbrowser.open")
     sql_backend = MockBackend()
     prompts = MockPrompts(
         {
@@ -1118,7 +944,6 @@ def test_triggering_assessment_wf(ws, mocker, mock_installation) -> None:
         }
     )
     config = WorkspaceConfig(inventory_database="ucx", policy_id='123')
-    wheels = create_autospec(WheelsV2)
     installation = mock_installation
     install_state = InstallState.from_installation(installation)
     workflows_installer = WorkflowsDeployment(
@@ -1127,20 +952,19 @@ def test_triggering_assessment_wf(ws, mocker, mock_installation) -> None:
         install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
-        Workflows.all(),
+        product_info,
+        all_workflows,
     )
     workspace_installation = WorkspaceInstallation(
-        config, installation, install_state, sql_backend, ws, workflows_installer, prompts, PRODUCT_INFO
+        config, installation, install_state, sql_backend, ws, workflows_installer, prompts, product_info
     )
     workspace_installation.run()
     wheels.upload_to_wsfs.assert_called()
     ws.jobs.run_now.assert_not_called()
 
 
-def test_triggering_assessment_wf_w_job(ws, mocker, mock_installation) -> None:
+def test_triggering_assessment_wf_w_job(ws, mocker, mock_installation, wheels, product_info, all_workflows) -> None:
     ws.jobs.run_now = mocker.Mock()
-    mocker.patch("webbrowser.open")
     sql_backend = MockBackend()
     prompts = MockPrompts(
         {
@@ -1150,7 +974,6 @@ def test_triggering_assessment_wf_w_job(ws, mocker, mock_installation) -> None:
         }
     )
     config = WorkspaceConfig(inventory_database="ucx", policy_id='123', trigger_job=True)
-    wheels = create_autospec(WheelsV2)
     installation = mock_installation
     install_state = InstallState.from_installation(installation)
     workflows_installer = WorkflowsDeployment(
@@ -1159,18 +982,18 @@ def test_triggering_assessment_wf_w_job(ws, mocker, mock_installation) -> None:
         install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
-        Workflows.all(),
+        product_info,
+        all_workflows,
     )
     workspace_installation = WorkspaceInstallation(
-        config, installation, install_state, sql_backend, ws, workflows_installer, prompts, PRODUCT_INFO
+        config, installation, install_state, sql_backend, ws, workflows_installer, prompts, product_info
     )
     workspace_installation.run()
     wheels.upload_to_wsfs.assert_called()
     ws.jobs.run_now.assert_called_once()
 
 
-def test_runs_upgrades_on_too_old_version(ws, any_prompt):
+def test_runs_upgrades_on_too_old_version(ws, any_prompt, wheels, product_info):
     existing_installation = MockInstallation(
         {
             'config.yml': {
@@ -1180,11 +1003,10 @@ def test_runs_upgrades_on_too_old_version(ws, any_prompt):
             },
         }
     )
-    wheels = create_autospec(WheelsV2)
     install = WorkspaceInstaller(ws).replace(
         prompts=any_prompt,
         installation=existing_installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
         sql_backend=MockBackend(),
         wheels=wheels,
     )
@@ -1194,7 +1016,7 @@ def test_runs_upgrades_on_too_old_version(ws, any_prompt):
     wheels.upload_to_wsfs.assert_called()
 
 
-def test_runs_upgrades_on_more_recent_version(ws, any_prompt):
+def test_runs_upgrades_on_more_recent_version(ws, any_prompt, wheels, product_info):
     existing_installation = MockInstallation(
         {
             'version.json': {'version': '0.3.0', 'wheel': '...', 'date': '...'},
@@ -1206,11 +1028,10 @@ def test_runs_upgrades_on_more_recent_version(ws, any_prompt):
             },
         }
     )
-    wheels = create_autospec(WheelsV2)
     install = WorkspaceInstaller(ws).replace(
         prompts=any_prompt,
         installation=existing_installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
         sql_backend=MockBackend(),
         wheels=wheels,
     )
@@ -1221,11 +1042,7 @@ def test_runs_upgrades_on_more_recent_version(ws, any_prompt):
     wheels.upload_to_wsfs.assert_called()
 
 
-def test_remove_jobs(ws, caplog, mock_installation_extra_jobs, any_prompt) -> None:
-    sql_backend = MockBackend()
-    install_state = InstallState.from_installation(mock_installation_extra_jobs)
-    wheels = create_autospec(WheelsV2)
-
+def test_remove_jobs(ws, caplog, mock_installation_extra_jobs, wheels, product_info, install_state_extra_jobs) -> None:
     class Dummy(Workflow):
         def __init__(self):
             super().__init__("assessment")
@@ -1237,40 +1054,16 @@ def test_remove_jobs(ws, caplog, mock_installation_extra_jobs, any_prompt) -> No
     workflows_installation = WorkflowsDeployment(
         WorkspaceConfig(inventory_database="...", policy_id='123'),
         mock_installation_extra_jobs,
-        install_state,
+        install_state_extra_jobs,
         ws,
         wheels,
-        PRODUCT_INFO,
+        product_info,
         Workflows([Dummy()]),
     )
 
-    workspace_installation = WorkspaceInstallation(
-        WorkspaceConfig(inventory_database='ucx'),
-        mock_installation_extra_jobs,
-        install_state,
-        sql_backend,
-        ws,
-        workflows_installation,
-        any_prompt,
-        PRODUCT_INFO,
-    )
+    ws.jobs.get.side_effect = _EXTRA_JOBS.__getitem__
 
-    def job_side_effect(job_id):
-        tasks = {
-            123: [jobs.Task('x', notebook_task=jobs.NotebookTask(notebook_path='~/mock/assessment'))],
-            124: [jobs.Task('y', python_wheel_task=jobs.PythonWheelTask('databricks_labs_ucx', 'runtime'))],
-            125: [jobs.Task('z', notebook_task=jobs.NotebookTask(notebook_path='outside-of-ucx'))],
-        }
-        return jobs.Job(
-            settings=jobs.JobSettings(
-                tasks=tasks[job_id],
-            ),
-        )
-
-    ws.jobs.get.side_effect = job_side_effect
-
-    with caplog.at_level('WARNING'):
-        workspace_installation.run()
+    workflows_installation.create_jobs()
 
     job_deletes = {_.args[0] for _ in ws.jobs.delete.mock_calls}
     assert len(job_deletes) == 1
@@ -1279,199 +1072,126 @@ def test_remove_jobs(ws, caplog, mock_installation_extra_jobs, any_prompt) -> No
     assert 'Corrupt installation state. Skipping job_id=125 as it is not managed by UCX' in caplog.messages
 
 
-def test_remove_jobs_already_deleted(ws, caplog, mock_installation_extra_jobs, any_prompt) -> None:
-    sql_backend = MockBackend()
+def test_remove_jobs_already_deleted(
+    ws, caplog, mock_installation_extra_jobs, wheels, product_info, install_state_extra_jobs
+) -> None:
     ws.jobs.delete.side_effect = InvalidParameterValue()
-    install_state = InstallState.from_installation(mock_installation_extra_jobs)
-    wheels = create_autospec(WheelsV2)
     workflows_installation = WorkflowsDeployment(
         WorkspaceConfig(inventory_database="...", policy_id='123'),
         mock_installation_extra_jobs,
-        install_state,
+        install_state_extra_jobs,
         ws,
         wheels,
-        PRODUCT_INFO,
+        product_info,
         Workflows([]),
     )
 
-    workspace_installation = WorkspaceInstallation(
-        WorkspaceConfig(inventory_database='ucx'),
-        mock_installation_extra_jobs,
-        install_state,
-        sql_backend,
-        ws,
-        workflows_installation,
-        any_prompt,
-        PRODUCT_INFO,
-    )
-
-    workspace_installation.run()
+    workflows_installation.create_jobs()
     wheels.upload_to_wsfs.assert_called()
 
 
-def test_get_existing_installation_global(ws, mock_installation):
-    base_prompts = MockPrompts(
-        {
-            r".*PRO or SERVERLESS SQL warehouse.*": "1",
-            r"Choose how to map the workspace groups.*": "2",
-            r"Open config file in.*": "no",
-            r"If hive_metastore contains managed table with external.*": "0",
-            r".*": "",
-        }
-    )
-
-    first_prompts = base_prompts.extend(
-        {
-            r"Inventory Database stored in hive_metastore.*": "ucx_global",
-            r".*": "",
-        }
-    )
-
-    installation = MockInstallation(
-        {
-            'config.yml': {
-                'inventory_database': 'ucx_global',
-                'connect': {
-                    'host': '...',
-                    'token': '...',
-                },
-            },
-        }
-    )
+def _existing_installation(is_global: bool) -> MockInstallation:
+    config = {
+        'inventory_database': 'ucx_global' if is_global else 'ucx_user',
+        'connect': {'host': '...', 'token': '...'},
+    }
+    return MockInstallation({'config.yml': config}, is_global=is_global)
 
-    first_install = WorkspaceInstaller(ws).replace(
-        prompts=first_prompts,
-        installation=installation,
-        product_info=PRODUCT_INFO,
-    )
-    workspace_config = first_install.configure()
-    assert workspace_config.inventory_database == 'ucx_global'
 
-    force_user_environ = {'UCX_FORCE_INSTALL': 'user'}
+_EXISTING_INSTALLATION_PROMPTS = _CONFIGURE_PROMPTS.extend(
+    {
+        r".*workspace group names.*": "g1, g2, g99",
+        r"If hive_metastore contains managed table with external.*": "0",
+    }
+)
 
-    second_prompts = base_prompts.extend(
-        {
-            r".*UCX is already installed on this workspace.*": "no",
-        }
-    )
-    # test for force user install variable without prompts
-    second_install = WorkspaceInstaller(ws, force_user_environ).replace(
-        prompts=second_prompts,
-        installation=installation,
-        product_info=PRODUCT_INFO,
-    )
-    with pytest.raises(RuntimeWarning, match='UCX is already installed, but no confirmation'):
-        second_install.configure()
 
-    # test for force user install variable with prompts
-    third_prompts = base_prompts.extend(
-        {
-            r".*UCX is already installed on this workspace.*": "yes",
-            r"Inventory Database stored in hive_metastore.*": "ucx_user",
-        }
-    )
-    third_install = WorkspaceInstaller(ws, force_user_environ).replace(
-        prompts=third_prompts,
-        installation=installation,
-        product_info=PRODUCT_INFO,
+@pytest.mark.parametrize(
+    "is_global,environ,prompts,expected_database",
+    [
+        (True, {}, {r"Inventory Database stored in hive_metastore.*": "ucx_global"}, "ucx_global"),
+        (
+            True,
+            {'UCX_FORCE_INSTALL': 'user'},
+            {
+                r".*UCX is already installed on this workspace.*": "yes",
+                r"Inventory Database stored in hive_metastore.*": "ucx_user",
+            },
+            "ucx_user",
+        ),
+        (
+            False,
+            {},
+            {
+                r".*UCX is already installed on this workspace.*": "yes",
+                r"Inventory Database stored in hive_metastore.*": "ucx_user",
+            },
+            "ucx_user",
+        ),
+    ],
+)
+def test_configure_existing_installation(ws, product_info, is_global, environ, prompts, expected_database) -> None:
+    install = WorkspaceInstaller(ws, environ).replace(
+        prompts=_EXISTING_INSTALLATION_PROMPTS.extend(prompts),
+        installation=_existing_installation(is_global),
+        product_info=product_info,
     )
-    workspace_config = third_install.configure()
-    assert workspace_config.inventory_database == 'ucx_user'
 
+    workspace_config = install.configure()
 
-def test_existing_installation_user(ws, mock_installation):
-    # test configure on existing user install
-    base_prompts = MockPrompts(
-        {
-            r".*PRO or SERVERLESS SQL warehouse.*": "1",
-            r"Choose how to map the workspace groups.*": "2",
-            r".*workspace group names.*": "g1, g2, g99",
-            r"Open config file in.*": "no",
-            r".*": "",
-        }
-    )
+    assert workspace_config.inventory_database == expected_database
 
-    first_prompts = base_prompts.extend(
-        {
-            r".*UCX is already installed on this workspace.*": "yes",
-            r"Inventory Database stored in hive_metastore.*": "ucx_user",
-            r".*": "",
-        }
-    )
 
-    installation = MockInstallation(
-        {
-            'config.yml': {
-                'inventory_database': 'ucx_user',
-                'connect': {
-                    'host': '...',
-                    'token': '...',
-                },
+@pytest.mark.parametrize(
+    "is_global,environ,prompts,expected_exception,expected_message",
+    [
+        (
+            True,
+            {'UCX_FORCE_INSTALL': 'user'},
+            {r".*UCX is already installed on this workspace.*": "no"},
+            RuntimeWarning,
+            "UCX is already installed, but no confirmation",
+        ),
+        (
+            False,
+            {'UCX_FORCE_INSTALL': 'global'},
+            {r".*UCX is already installed on this workspace.*": "no"},
+            RuntimeWarning,
+            "UCX is already installed, but no confirmation",
+        ),
+        (
+            False,
+            {'UCX_FORCE_INSTALL': 'global'},
+            {
+                r".*UCX is already installed on this workspace.*": "yes",
+                r"Inventory Database stored in hive_metastore.*": "ucx_user_new",
             },
-        },
-        is_global=False,
-    )
-    first_install = WorkspaceInstaller(ws).replace(
-        prompts=first_prompts,
-        installation=installation,
-        product_info=PRODUCT_INFO,
-    )
-    workspace_config = first_install.configure()
-    assert workspace_config.inventory_database == 'ucx_user'
-
-    # test for force global install variable without prompts
-    # resetting prompts to remove confirmation
-    second_prompts = base_prompts.extend(
-        {
-            r".*UCX is already installed on this workspace.*": "no",
-        }
-    )
-
-    force_global_env = {'UCX_FORCE_INSTALL': 'global'}
-    second_install = WorkspaceInstaller(ws, force_global_env).replace(
-        prompts=second_prompts,
-        installation=installation,
-        product_info=PRODUCT_INFO,
-    )
-    with pytest.raises(RuntimeWarning, match='UCX is already installed, but no confirmation'):
-        second_install.configure()
-
-    # test for force global install variable with prompts
-    third_prompts = base_prompts.extend(
-        {
-            r".*UCX is already installed on this workspace.*": "yes",
-            r"Inventory Database stored in hive_metastore.*": "ucx_user_new",
-            r".*": "",
-        }
+            NotImplemented,
+            "Migration needed. Not implemented yet.",
+        ),
+    ],
+)
+def test_forced_install_over_existing_installation_fails(
+    ws, product_info, is_global, environ, prompts, expected_exception, expected_message
+) -> None:
+    install = WorkspaceInstaller(ws, environ).replace(
+        prompts=_EXISTING_INSTALLATION_PROMPTS.extend(prompts),
+        installation=_existing_installation(is_global),
+        product_info=product_info,
     )
 
-    third_install = WorkspaceInstaller(ws, force_global_env).replace(
-        prompts=third_prompts,
-        installation=installation,
-        product_info=PRODUCT_INFO,
-    )
-    with pytest.raises(NotImplemented, match="Migration needed. Not implemented yet."):
-        third_install.configure()
+    with pytest.raises(expected_exception, match=expected_message):
+        install.configure()
 
 
-def test_databricks_runtime_version_set(ws, mock_installation):
-    prompts = MockPrompts(
-        {
-            r".*": "",
-        }
-    )
-    product_info = ProductInfo.for_testing(WorkspaceConfig)
+def test_databricks_runtime_version_set(ws):
     environ = {'DATABRICKS_RUNTIME_VERSION': "13.3"}
 
     with pytest.raises(SystemExit, match="WorkspaceInstaller is not supposed to be executed in Databricks Runtime"):
-        WorkspaceInstaller(ws, environ).replace(
-            prompts=prompts,
-            installation=mock_installation,
-            product_info=product_info,
-        )
+        WorkspaceInstaller(ws, environ)
 
 
-def test_check_inventory_database_exists(ws, mock_installation):
+def test_check_inventory_database_exists(ws, mock_installation, product_info):
     ws.current_user.me().user_name = "foo"
 
     prompts = MockPrompts(
@@ -1487,24 +1207,23 @@ def test_check_inventory_database_exists(ws, mock_installation):
     install = WorkspaceInstaller(ws).replace(
         prompts=prompts,
         installation=installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
     )
 
     with pytest.raises(AlreadyExists, match="Inventory database 'ucx_exists' already exists in another installation"):
         install.configure()
 
 
-def test_user_not_admin(ws, mock_installation) -> None:
+def test_user_not_admin(ws, mock_installation, wheels, product_info, all_workflows, install_state) -> None:
     ws.current_user.me = lambda: iam.User(user_name="me@example.com", groups=[iam.ComplexValue(display="group1")])
-    wheels = create_autospec(WheelsV2)
     workspace_installation = WorkflowsDeployment(
         WorkspaceConfig(inventory_database='ucx', policy_id='123'),
         mock_installation,
-        InstallState.from_installation(mock_installation),
+        install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
-        Workflows.all(),
+        product_info,
+        all_workflows,
     )
 
     with pytest.raises(PermissionDenied) as failure:
@@ -1521,18 +1240,7 @@ def test_user_not_admin(ws, mock_installation) -> None:
         (RunState(result_state=RunResultState.FAILED, life_cycle_state=RunLifeCycleState.TERMINATED), False),
     ],
 )
-def test_validate_step(ws, result_state, expected):
-    installation = MockInstallation(
-        {
-            'state.json': {
-                'resources': {
-                    'jobs': {"assessment": "123"},
-                }
-            }
-        }
-    )
-    install_state = InstallState.from_installation(installation)
-    deployed = DeployedWorkflows(ws, install_state)
+def test_validate_step(ws, deployed, result_state, expected):
     ws.jobs.list_runs.return_value = [
         BaseRun(
             job_id=123,
@@ -1562,7 +1270,6 @@ def test_validate_step(ws, result_state, expected):
 def test_are_remote_local_versions_equal(ws, mock_installation, mocker):
     ws.jobs.run_now = mocker.Mock()
 
-    mocker.patch("webbrowser.open")
     base_prompts = MockPrompts(
         {
             r"Open config file in.*": "yes",
@@ -1660,6 +1367,7 @@ def test_account_installer(ws):
                 r".*": "",
             }
         ),
+        # The testing product info makes the workspace installers return after configuring, skipping the deployment
         product_info=ProductInfo.for_testing(WorkspaceConfig),
     )
     account_installer.install_on_account()
@@ -1669,14 +1377,12 @@ def test_account_installer(ws):
 
 
 @pytest.fixture
-def mock_ws():
+def mock_ws(ws):
     def get_status(path: str):
         raise NotFound(path)
 
-    workspace_client = create_autospec(WorkspaceClient)  # pylint: disable=mock-no-usage
-    workspace_client.workspace.get_status = get_status
-
-    return workspace_client
+    ws.workspace.get_status = get_status
+    return ws
 
 
 def test_global_workspace_installer(mock_ws):
@@ -1694,9 +1400,8 @@ def test_user_workspace_installer(mock_ws):
     assert workspace_installer.install_state.install_folder().startswith("/Users/")
 
 
-def test_save_config_ext_hms(ws, mock_installation) -> None:
-    ws.get_workspace_id.return_value = 12345678
-    cluster_policy = {
+_EXT_HMS_POLICY_JSON = json.dumps(
+    {
         "spark_conf.spark.hadoop.javax.jdo.option.ConnectionURL": {"value": "url"},
         "spark_conf.spark.hadoop.javax.jdo.option.ConnectionUserName": {"value": "user1"},
         "spark_conf.spark.hadoop.javax.jdo.option.ConnectionPassword": {"value": "pwd"},
@@ -1704,28 +1409,30 @@ def test_save_config_ext_hms(ws, mock_installation) -> None:
         "spark_conf.spark.sql.hive.metastore.version": {"value": "0.13"},
         "spark_conf.spark.sql.hive.metastore.jars": {"value": "jar1"},
     }
+)
+
+
+def test_save_config_ext_hms(ws, mock_installation, product_info) -> None:
+    ws.get_workspace_id.return_value = 12345678
     ws.cluster_policies.list.return_value = [
         Policy(
             policy_id="id1",
             name="foo",
-            definition=json.dumps(cluster_policy),
+            definition=_EXT_HMS_POLICY_JSON,
             description="Custom cluster policy for Unity Catalog Migration (UCX)",
         )
     ]
     prompts = MockPrompts(
         {
-            r".*PRO or SERVERLESS SQL warehouse.*": "1",
-            r"Choose how to map the workspace groups.*": "2",  # specify names
+            **_BASE_PROMPTS,
             r"Comma-separated list of databases to migrate.*": "db1,db2",
             r"Reconciliation threshold, in percentage.*": "5",
-            r"If hive_metastore contains managed table with external.*": "1",
-            r".*": "",
         }
     )
     install = WorkspaceInstaller(ws).replace(
         prompts=prompts,
         installation=mock_installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
     )
     install.configure()
 
@@ -1753,7 +1460,7 @@ def test_save_config_ext_hms(ws, mock_installation) -> None:
     )
 
 
-def test_upload_dependencies(ws, mock_installation):
+def test_upload_dependencies(ws, mock_installation, wheels, product_info):
     prompts = MockPrompts(
         {
             r".*": "",
@@ -1763,7 +1470,6 @@ def test_upload_dependencies(ws, mock_installation):
             r"If hive_metastore contains managed table with external.*": "1",
         }
     )
-    wheels = create_autospec(WheelsV2)
     wheels.upload_wheel_dependencies.return_value = [
         'databricks_labs_blueprint-0.6.2-py3-none-any.whl',
         'databricks_sdk-0.28.0-py3-none-any.whl',
@@ -1774,7 +1480,7 @@ def test_upload_dependencies(ws, mock_installation):
     workspace_installation = WorkspaceInstaller(ws).replace(
         prompts=prompts,
         installation=mock_installation,
-        product_info=PRODUCT_INFO,
+        product_info=product_info,
         sql_backend=MockBackend(),
         wheels=wheels,
     )
@@ -1783,22 +1489,25 @@ def test_upload_dependencies(ws, mock_installation):
     wheels.upload_to_wsfs.assert_called()
 
 
-@pytest.fixture
-def no_connection_ws() -> WorkspaceClient:
-    """Configure a workspace like it does not have an internet connection."""
+@credentials_strategy("raise_connection_error", [])
+def _raise_connection_error(_: Any):
+    """Mock no internet access by raising a ConnectionError"""
+
+    def inner():
+        raise RequestsConnectionError("no internet")
 
-    @credentials_strategy("raise_connection_error", [])
-    def raise_connection_error(_: Any):
-        """Mock no internet access by raising a ConnectionError"""
+    return inner
 
-        def inner():
-            raise RequestsConnectionError("no internet")
 
-        return inner
+@pytest.fixture(scope="module")
+def no_connection_ws() -> WorkspaceClient:
+    """Configure a workspace like it does not have an internet connection.
 
+    The client is shared by the tests in this module as it holds no state: every request fails to authenticate.
+    """
     config = Config(
         host="https://adb-123456789.12.azuredatabricks.net/",
-        credentials_strategy=raise_connection_error,
+        credentials_strategy=_raise_connection_error,
         retry_timeout_seconds=1,
     )
     return WorkspaceClient(config=config)
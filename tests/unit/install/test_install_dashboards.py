@@ -1,10 +1,9 @@
 import logging
-from unittest import mock
 
 import pytest
 from databricks.labs.blueprint.installation import MockInstallation
 from databricks.labs.blueprint.installer import InstallState
-from databricks.labs.blueprint.wheels import ProductInfo, WheelsV2, find_project_root
+from databricks.labs.blueprint.wheels import find_project_root
 from databricks.labs.lsql.backends import MockBackend
 from databricks.labs.lsql.dashboards import DashboardMetadata
 from databricks.sdk.errors.platform import BadRequest
@@ -17,21 +16,17 @@ from databricks.labs.ucx.installer.workflows import WorkflowsDeployment
 from databricks.labs.ucx.runtime import Workflows
 
 
-PRODUCT_INFO = ProductInfo.from_class(WorkspaceConfig)
-
-
 @pytest.fixture
-def workspace_installation(request, ws, any_prompt) -> WorkspaceInstallation:
+def workspace_installation(request, ws, any_prompt, wheels, product_info) -> WorkspaceInstallation:
     mock_installation = request.param if hasattr(request, "param") else MockInstallation()
     install_state = InstallState.from_installation(mock_installation)
-    wheels = mock.create_autospec(WheelsV2)
     workflows_installation = WorkflowsDeployment(
         WorkspaceConfig(inventory_database="..."),
         mock_installation,
         install_state,
         ws,
         wheels,
-        PRODUCT_INFO,
+        product_info,
         Workflows([]),
     )
     return WorkspaceInstallation(
@@ -42,7 +37,7 @@ def workspace_installation(request, ws, any_prompt) -> WorkspaceInstallation:
         ws,
         workflows_installation,
         any_prompt,
-        PRODUCT_INFO,
+        product_info,
     )
 
 
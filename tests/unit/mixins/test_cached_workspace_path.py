@@ -65,6 +65,21 @@ def test_download_is_only_called_once_across_instances() -> None:
     assert ws.workspace.download.call_count == 1
 
 
+def test_download_evicts_path_read_once_before_path_read_repeatedly() -> None:
+    ws = mock_workspace_client()
+    ws.workspace.download.side_effect = lambda _, *, format: io.BytesIO("abc".encode())
+    cache = WorkspaceCache(ws, max_entries=2)
+    for _ in range(0, 2):
+        _ = cache.get_workspace_path("/shared/path").read_text()
+    _ = cache.get_workspace_path("/once/path").read_text()
+    _ = cache.get_workspace_path("/other/path").read_text()  # Evicts "/once/path"
+    assert ws.workspace.download.call_count == 3
+    _ = cache.get_workspace_path("/shared/path").read_text()
+    assert ws.workspace.download.call_count == 3
+    _ = cache.get_workspace_path("/once/path").read_text()
+    assert ws.workspace.download.call_count == 4
+
+
 def test_download_is_called_again_after_unlink() -> None:
     ws = mock_workspace_client()
     ws.workspace.download.side_effect = lambda _, *, format: io.BytesIO("abc".encode())
@@ -58,3 +58,29 @@ def test_linter_context_linter_apply_fixes_no_operation() -> None:
     context = LinterContext(TableMigrationIndex([]))
     fixed_code = context.apply_fixes(Language.PYTHON, "print(1)")
     assert fixed_code == "print(1)"
+
+
+def test_linter_context_linter_apply_fixes_migrates_python(migration_index) -> None:
+    context = LinterContext(migration_index)
+    code = "df = spark.read.table('old.things')\nspark.sql('SELECT * FROM old.things')"
+    fixed_code = context.apply_fixes(Language.PYTHON, code)
+    assert fixed_code.rstrip() == (
+        "df = spark.read.table('brand.new.stuff')\nspark.sql('SELECT * FROM brand.new.stuff')"
+    )
+
+
+def test_linter_context_linter_apply_fixes_keeps_unparsable_python(migration_index) -> None:
+    context = LinterContext(migration_index)
+    fixed_code = context.apply_fixes(Language.PYTHON, "print(")
+    assert fixed_code == "print("
+
+
+def test_linter_context_reset_restores_session_state(migration_index) -> None:
+    context = LinterContext(migration_index)
+    linter = context.linter(Language.SQL)
+
+    list(linter.lint("USE other"))
+    assert context.session_state.schema == "other"
+    context.reset()
+
+    assert context.session_state.schema == "default"
@@ -18,6 +18,7 @@ from databricks.labs.ucx.source_code.linters.folders import LocalCodeLinter
 from databricks.labs.ucx.source_code.notebooks.loaders import NotebookLoader, NotebookResolver
 from databricks.labs.ucx.source_code.notebooks.sources import Notebook
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
+from databricks.labs.ucx.source_code.python.ast_cache import ASTCache
 from databricks.labs.ucx.source_code.python_libraries import PythonLibraryResolver
 
 from tests.unit import locate_site_packages
@@ -43,7 +44,7 @@ def test_file_linter_lints_file() -> None:
     dependency.load.assert_called_once_with(path_lookup)
     path_lookup.assert_not_called()  # not used as the `load` method is mocked
     context.linter.assert_called_once_with(Language.PYTHON)
-    python_linter.lint.assert_called_once_with("print(1)")
+    python_linter.lint_tree.assert_called_once()  # Python files are parsed by the file linter
 
 
 def test_file_linter_lints_python(tmp_path, migration_index, mock_path_lookup) -> None:
@@ -55,6 +56,20 @@ def test_file_linter_lints_python(tmp_path, migration_index, mock_path_lookup) -
     assert not advices
 
 
+def test_file_linter_lints_python_with_ast_cache(tmp_path, migration_index, mock_path_lookup) -> None:
+    path = tmp_path / "xyz.py"
+    path.write_text("display(spark.table('old.things'))")
+    dependency = Dependency(FileLoader(), path)
+    ast_cache = ASTCache(tmp_path / "cache")
+
+    first = list(FileLinter(dependency, mock_path_lookup, LinterContext(migration_index), ast_cache=ast_cache).lint())
+    second = list(FileLinter(dependency, mock_path_lookup, LinterContext(migration_index), ast_cache=ast_cache).lint())
+
+    assert first and first == second
+    assert ast_cache.misses == 1
+    assert ast_cache.hits == 1
+
+
 def test_file_linter_lints_sql(tmp_path, migration_index, mock_path_lookup) -> None:
     path = tmp_path / "xyz.sql"
     path.write_text("SELECT * FROM dual")
@@ -168,6 +183,18 @@ def test_single_dot_import() -> None:
     path_lookup.resolve.assert_called_once_with(Path('/some/path/to/folder/foo.py'))
 
 
+def test_double_dot_import_of_dotted_module() -> None:
+    file_resolver = ImportFileResolver(FileLoader())
+    path_lookup = create_autospec(PathLookup)
+    path_lookup.cwd.as_posix.return_value = '/some/path/to/folder'
+    path_lookup.resolve.return_value = Path('/some/path/to/foo/bar.py')
+
+    maybe = file_resolver.resolve_import(path_lookup, "..foo.bar")
+    assert not maybe.problems
+    assert maybe.dependency is not None
+    path_lookup.resolve.assert_called_once_with(Path('/some/path/to/folder/../foo/bar.py'))
+
+
 site_packages = locate_site_packages()
 
 
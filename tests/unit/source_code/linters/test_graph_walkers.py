@@ -8,6 +8,7 @@ import pytest
 from databricks.labs.ucx.source_code.base import CurrentSessionState, DirectFsAccess
 from databricks.labs.ucx.source_code.graph import Dependency, DependencyGraph
 from databricks.labs.ucx.source_code.files import FileLoader
+from databricks.labs.ucx.source_code.folders import FolderLoader
 from databricks.labs.ucx.source_code.linters.context import LinterContext
 from databricks.labs.ucx.source_code.linters.graph_walkers import (
     DependencyGraphWalker,
@@ -18,6 +19,7 @@ from databricks.labs.ucx.source_code.linters.graph_walkers import (
 from databricks.labs.ucx.source_code.notebooks.cells import CellLanguage
 from databricks.labs.ucx.source_code.notebooks.loaders import NotebookLoader
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
+from databricks.labs.ucx.source_code.python.ast_cache import ASTCache
 from databricks.labs.ucx.source_code.python.python_ast import Tree
 
 
@@ -64,16 +66,36 @@ def test_graph_walker_captures_walked_paths(mock_path_lookup, grand_parent_graph
             assert len(self._walked_paths) == self.walked_paths_count
             self.walked_paths_count += 1
             if dependency == grand_parent_graph.dependency:
-                assert grand_parent_graph.dependency.path in self._walked_paths
+                assert str(grand_parent_graph.dependency.path) in self._walked_paths
             elif dependency == child_dependency:
-                assert grand_parent_graph.dependency.path in self._walked_paths
-                assert child_dependency.path in self._walked_paths
+                assert str(grand_parent_graph.dependency.path) in self._walked_paths
+                assert str(child_dependency.path) in self._walked_paths
             return []
 
     walker = _TestWalker(grand_parent_graph, mock_path_lookup)
     list(walker)
 
 
+def test_graph_walker_walks_roots_sorted_by_path(tmp_path, mock_path_lookup, simple_dependency_resolver) -> None:
+    for name in "b.py", "c.py", "a.py":
+        (tmp_path / name).touch()
+    dependency = Dependency(FolderLoader(NotebookLoader(), FileLoader()), tmp_path, inherits_context=False)
+    graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
+    container = graph.dependency.load(graph.path_lookup)
+    assert container is not None
+    assert not list(container.build_dependency_graph(graph))
+
+    class _TestWalker(DependencyGraphWalker):
+        def _process_dependency(
+            self, dependency: Dependency, path_lookup: PathLookup, inherited_tree: Tree | None
+        ) -> Iterable[Path]:
+            yield dependency.path
+
+    walker = _TestWalker(graph, mock_path_lookup)
+
+    assert list(walker) == [tmp_path / "a.py", tmp_path / "b.py", tmp_path / "c.py"]
+
+
 def test_graph_walker_logs_analyzing_dependency_in_debug(
     caplog, mock_path_lookup, grand_parent_graph: DependencyGraph
 ) -> None:
@@ -131,3 +153,24 @@ def test_collector_supports_all_cell_languages(language, mock_path_lookup, migra
     graph.assert_not_called()
     collector = _TestCollectorWalker(graph, mock_path_lookup, CurrentSessionState(), migration_index)
     list(collector.collect_from_source(language))
+
+
+def test_linter_walker_counts_ast_cache_use(
+    tmp_path, mock_path_lookup, simple_dependency_resolver, migration_index
+) -> None:
+    source_path = tmp_path / "source"
+    source_path.mkdir()
+    for name in "first.py", "second.py":
+        (source_path / name).write_text(f"print('{name}')")
+    dependency = Dependency(FolderLoader(NotebookLoader(), FileLoader()), source_path, inherits_context=False)
+    graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
+    container = graph.dependency.load(graph.path_lookup)
+    assert container is not None
+    assert not list(container.build_dependency_graph(graph))
+    ast_cache = ASTCache(tmp_path / "cache")
+    walker = LinterWalker(graph, mock_path_lookup, lambda: LinterContext(migration_index), ast_cache=ast_cache)
+
+    list(walker)
+
+    assert ast_cache.misses == 2
+    assert ast_cache.hits == 0
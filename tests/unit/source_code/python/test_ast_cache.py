@@ -0,0 +1,177 @@
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from databricks.labs.ucx.source_code.python.ast_cache import ASTCache
+from databricks.labs.ucx.source_code.python.python_ast import MaybeTree
+
+
+def test_ast_cache_misses_uncached_source(tmp_path) -> None:
+    cache = ASTCache(tmp_path)
+    assert cache.get(Path("a.py"), "a = 1") is None
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+
+def test_ast_cache_hits_cached_source(tmp_path) -> None:
+    maybe_tree = MaybeTree.from_source_code("a = 1")
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+
+    cache.put(Path("a.py"), "a = 1", maybe_tree.tree)
+    tree = cache.get(Path("a.py"), "a = 1")
+
+    assert tree is not None
+    assert tree.node.as_string() == maybe_tree.tree.node.as_string()
+    assert cache.hits == 1
+
+
+def test_ast_cache_is_keyed_by_source(tmp_path) -> None:
+    maybe_tree = MaybeTree.from_source_code("a = 1")
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+
+    cache.put(Path("a.py"), "a = 1", maybe_tree.tree)
+
+    assert cache.get(Path("a.py"), "a = 2") is None
+
+
+def test_ast_cache_ignores_corrupted_entry(tmp_path) -> None:
+    maybe_tree = MaybeTree.from_source_code("a = 1")
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+    cache.put(Path("a.py"), "a = 1", maybe_tree.tree)
+    for cache_path in tmp_path.glob("*.pkl"):
+        cache_path.write_bytes(b"corrupted")
+
+    assert cache.get(Path("a.py"), "a = 1") is None
+
+
+def test_ast_cache_skips_unpicklable_tree(tmp_path) -> None:
+    # astroid attaches inference tips to `namedtuple` calls, which cannot be pickled
+    source = "from collections import namedtuple\nPoint = namedtuple('Point', ['x', 'y'])"
+    maybe_tree = MaybeTree.from_source_code(source)
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+
+    cache.put(Path("a.py"), source, maybe_tree.tree)
+
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_ast_cache_does_not_pickle_unpicklable_tree_again(tmp_path) -> None:
+    source = "from collections import namedtuple\nPoint = namedtuple('Point', ['x', 'y'])"
+    maybe_tree = MaybeTree.from_source_code(source)
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+    cache.put(Path("a.py"), source, maybe_tree.tree)
+
+    with patch("pickle.dumps") as dumps:
+        cache.put(Path("a.py"), source, maybe_tree.tree)
+
+    dumps.assert_not_called()
+    assert len(list(tmp_path.glob("*.unpicklable"))) == 1
+
+
+def test_ast_cache_prunes_expired_entries(tmp_path) -> None:
+    maybe_tree = MaybeTree.from_source_code("a = 1")
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+    cache.put(Path("a.py"), "a = 1", maybe_tree.tree)
+    cache.put(Path("b.py"), "b = 1", maybe_tree.tree)
+    expired = time.time() - timedelta(days=31).total_seconds()
+    for cache_path in tmp_path.glob("*.pkl"):
+        os.utime(cache_path, (expired, expired))
+    assert cache.get(Path("a.py"), "a = 1") is not None  # Refreshes the entry
+
+    cache.prune(max_age=timedelta(days=30))
+
+    assert cache.get(Path("a.py"), "a = 1") is not None
+    assert cache.get(Path("b.py"), "b = 1") is None
+
+
+def test_ast_cache_prunes_least_recently_used_entries_beyond_max_bytes(tmp_path) -> None:
+    maybe_tree = MaybeTree.from_source_code("a = 1")
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+    cache.put(Path("a.py"), "a = 1", maybe_tree.tree)
+    cache.put(Path("b.py"), "b = 1", maybe_tree.tree)
+    cache_paths = list(tmp_path.glob("*.pkl"))
+    for index, cache_path in enumerate(cache_paths):
+        os.utime(cache_path, (time.time() - 100 + index, time.time() - 100 + index))
+    max_bytes = cache_paths[-1].stat().st_size
+
+    cache.prune(max_bytes=max_bytes)
+
+    assert [cache_path.exists() for cache_path in cache_paths] == [False, True]
+
+
+def test_ast_cache_parses_tree_with_inference_tips_from_cache(tmp_path) -> None:
+    # astroid attaches inference tips to `namedtuple` calls, these are attached after getting the tree from the cache
+    source = "from collections import namedtuple\nPoint = namedtuple('Point', ['x', 'y'])"
+    cache = ASTCache(tmp_path)
+    cache.parse(Path("a.py"), source)
+
+    maybe_tree = cache.parse(Path("a.py"), source)
+
+    assert maybe_tree.tree is not None
+    assert cache.hits == 1
+    assert not list(tmp_path.glob("*.unpicklable"))
+    assigned = maybe_tree.tree.node.body[1].value
+    assert [type(inferred).__name__ for inferred in assigned.inferred()] == ["ClassDef"]
+
+
+def test_ast_cache_parse_returns_parse_failure(tmp_path) -> None:
+    cache = ASTCache(tmp_path)
+
+    maybe_tree = cache.parse(Path("a.py"), "a =")
+
+    assert maybe_tree.failure is not None
+    assert not list(tmp_path.iterdir())
+
+
+def test_ast_cache_prune_skips_entries_removed_concurrently(tmp_path) -> None:
+    maybe_tree = MaybeTree.from_source_code("a = 1")
+    assert maybe_tree.tree is not None
+    cache = ASTCache(tmp_path)
+    cache.put(Path("a.py"), "a = 1", maybe_tree.tree)
+    cache_paths = [tmp_path / "removed.pkl", *tmp_path.glob("*.pkl")]
+
+    with patch.object(Path, "iterdir", return_value=iter(cache_paths)):
+        cache.prune(max_bytes=0)
+
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_ast_cache_prunes_temporary_files_of_interrupted_writes(tmp_path) -> None:
+    interrupted = tmp_path / "interrupted.tmp"
+    interrupted.touch()
+    expired = time.time() - timedelta(hours=2).total_seconds()
+    os.utime(interrupted, (expired, expired))
+    ongoing = tmp_path / "ongoing.tmp"
+    ongoing.touch()
+
+    ASTCache(tmp_path).prune()
+
+    assert not interrupted.exists()
+    assert ongoing.exists()
+
+
+def test_ast_cache_from_user_cache_directory_honours_xdg_cache_home(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("UCX_NO_AST_CACHE", raising=False)
+
+    cache = ASTCache.from_user_cache_directory()
+
+    assert cache is not None
+    cache.parse(Path("a.py"), "a = 1")
+    assert list((tmp_path / "ucx" / "ast").glob("*.pkl"))
+
+
+def test_ast_cache_from_user_cache_directory_is_disabled_by_environment(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("UCX_NO_AST_CACHE", "1")
+
+    assert ASTCache.from_user_cache_directory() is None
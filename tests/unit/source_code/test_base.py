@@ -1,9 +1,14 @@
 import dataclasses
+import io
 import logging
+import threading
 from pathlib import Path
 from unittest.mock import create_autospec, patch
 
 import pytest
+from databricks.labs.blueprint.paths import WorkspacePath
+from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.workspace import ImportFormat, Language, ObjectInfo, ObjectType
 
 from databricks.labs.ucx.source_code.base import (
     Advice,
@@ -14,6 +19,10 @@ from databricks.labs.ucx.source_code.base import (
     LocatedAdvice,
     UsedTable,
     back_up_path,
+    cache_local_text_reads,
+    infer_file_language_if_supported,
+    is_a_notebook,
+    iter_caching_local_text_reads,
     revert_back_up_path,
     safe_write_text,
     safe_read_text,
@@ -171,6 +180,103 @@ def test_write_text_to_existing_file(tmp_path) -> None:
     assert number_of_characters_written == len("content")
 
 
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "utf-32"])
+def test_write_text_preserves_bom(tmp_path, encoding: str) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("some longer original content", encoding=encoding)
+
+    number_of_characters_written = write_text(path, "content")
+
+    assert path.read_text(encoding=encoding) == "content"
+    assert number_of_characters_written == len("content")
+
+
+def test_write_text_to_workspace_path_uploads_content() -> None:
+    ws = create_autospec(WorkspaceClient)
+    ws.workspace.get_status.return_value = ObjectInfo(object_type=ObjectType.FILE, path="/file.txt")
+    ws.workspace.download.side_effect = lambda *_, **__: io.BytesIO("original".encode("utf-8"))
+    path = WorkspacePath(ws, "/file.txt")
+
+    number_of_characters_written = write_text(path, "content")
+
+    assert number_of_characters_written == len("content")
+    ws.workspace.upload.assert_called_with("/file.txt", "content", format=ImportFormat.AUTO)
+
+
+def test_safe_read_text_reads_written_text(tmp_path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+    with cache_local_text_reads():
+        assert safe_read_text(path) == "content"
+
+        write_text(path, "changed")
+
+        assert safe_read_text(path) == "changed"
+
+
+def test_safe_read_text_caches_local_reads_within_context(tmp_path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+
+    with cache_local_text_reads(), patch("databricks.labs.ucx.source_code.base.read_text") as read_text:
+        read_text.return_value = "content"
+        assert safe_read_text(path) == "content"
+        assert safe_read_text(path) == "content"
+
+    read_text.assert_called_once_with(path)
+
+
+def test_safe_read_text_does_not_cache_local_reads_outside_context(tmp_path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+    with cache_local_text_reads():
+        assert safe_read_text(path) == "content"
+
+    with patch("databricks.labs.ucx.source_code.base.read_text") as read_text:
+        read_text.return_value = "changed"
+        assert safe_read_text(path) == "changed"
+
+
+def test_safe_read_text_does_not_cache_local_reads_in_other_threads(tmp_path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+    texts = []
+
+    with cache_local_text_reads(), patch("databricks.labs.ucx.source_code.base.read_text") as read_text:
+        read_text.return_value = "content"
+        assert safe_read_text(path) == "content"
+        thread = threading.Thread(target=lambda: texts.append(safe_read_text(path)))
+        thread.start()
+        thread.join()
+
+    assert texts == ["content"]
+    assert read_text.call_count == 2
+
+
+def test_iter_caching_local_text_reads_caches_reads_while_producing_items(tmp_path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+
+    with patch("databricks.labs.ucx.source_code.base.read_text") as read_text:
+        read_text.return_value = "content"
+        texts = list(iter_caching_local_text_reads(safe_read_text(path) for _ in range(2)))
+
+    assert texts == ["content", "content"]
+    read_text.assert_called_once_with(path)
+
+
+def test_iter_caching_local_text_reads_does_not_cache_reads_while_handling_items(tmp_path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+
+    with patch("databricks.labs.ucx.source_code.base.read_text") as read_text:
+        read_text.return_value = "content"
+        for text in iter_caching_local_text_reads(safe_read_text(path) for _ in range(2)):
+            assert safe_read_text(path) == text
+
+    assert read_text.call_count == 3
+
+
 def test_write_text_with_permission_error(tmp_path) -> None:
     path = create_autospec(Path)
     path.write_text.side_effect = PermissionError("Permission denied")
@@ -291,3 +397,45 @@ def test_revert_back_up_when_backup_file_cannot_be_deleted(caplog) -> None:
     assert is_successfully_reverted_backup
     assert f"Cannot remove backup file: {path_backed_up}"
     path_backed_up.assert_not_called()
+
+
+def test_is_a_notebook_skips_reading_unsupported_file() -> None:
+    path = create_autospec(Path)
+    path.suffix = ".txt"
+    assert not is_a_notebook(path)
+    path.stat.assert_not_called()
+    path.is_file.assert_not_called()
+
+
+def test_is_a_notebook_detects_changed_file(tmp_path) -> None:
+    path = tmp_path / "notebook.py"
+    path.write_text("print(1)\n")
+    assert not is_a_notebook(path)
+
+    path.write_text("# Databricks notebook source\nprint(1)\n")
+
+    assert is_a_notebook(path)
+
+
+def test_is_a_notebook_uses_prefetched_stat_result(tmp_path) -> None:
+    path = tmp_path / "notebook.py"
+    path.write_text("# Databricks notebook source\nprint(1)\n")
+    stat_result = path.stat()
+    path.unlink()
+
+    assert is_a_notebook(path, "# Databricks notebook source\nprint(1)\n", stat_result=stat_result)
+
+
+@pytest.mark.parametrize(
+    "name, language",
+    [
+        ("file.py", Language.PYTHON),
+        ("file.PY", Language.PYTHON),
+        ("file.sql", Language.SQL),
+        ("file.Sql", Language.SQL),
+        ("file.scala", None),
+        ("file", None),
+    ],
+)
+def test_infer_file_language_if_supported(name: str, language: Language | None) -> None:
+    assert infer_file_language_if_supported(Path(name)) == language
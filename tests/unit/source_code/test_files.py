@@ -8,7 +8,7 @@ from databricks.sdk.service.workspace import Language
 from databricks.labs.ucx.source_code.base import CurrentSessionState
 from databricks.labs.ucx.source_code.graph import Dependency, DependencyGraph, DependencyProblem, StubContainer
 from databricks.labs.ucx.source_code.files import FileLoader, ImportFileResolver, LocalFile
-from databricks.labs.ucx.source_code.known import KnownDependency
+from databricks.labs.ucx.source_code.known import KnownDependency, KnownList
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
 
 
@@ -308,3 +308,16 @@ def test_import_resolver_resolves_import_from_known_list_with_problems() -> None
     assert container
     assert not container.build_dependency_graph(graph)
     graph.assert_not_called()
+
+
+def test_import_resolver_looks_up_known_list_once_per_import() -> None:
+    allow_list = create_autospec(KnownList)
+    allow_list.module_compatibility.return_value = KnownList().module_compatibility("os")
+    import_file_resolver = ImportFileResolver(FileLoader(), allow_list=allow_list)
+    path_lookup = create_autospec(PathLookup)
+
+    first = import_file_resolver.resolve_import(path_lookup, "os")
+    second = import_file_resolver.resolve_import(path_lookup, "os")
+
+    assert first.dependency == second.dependency
+    allow_list.module_compatibility.assert_called_once_with("os")
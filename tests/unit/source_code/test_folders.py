@@ -1,11 +1,11 @@
 from pathlib import Path
-from unittest.mock import create_autospec
+from unittest.mock import create_autospec, patch
 
 import pytest
 
 from databricks.labs.ucx.source_code.base import CurrentSessionState
 from databricks.labs.ucx.source_code.files import FileLoader
-from databricks.labs.ucx.source_code.folders import FolderLoader, Folder
+from databricks.labs.ucx.source_code.folders import FolderLoader, Folder, _is_on_network_file_system
 from databricks.labs.ucx.source_code.graph import Dependency, DependencyGraph
 from databricks.labs.ucx.source_code.notebooks.loaders import NotebookLoader
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
@@ -35,7 +35,7 @@ def test_folder_build_dependency_graph_without_problems(mock_path_lookup, graph_
     """No problems should arise form building the dependency graph for the sample folder"""
     folder = graph_parent_child_context.dependency.load(mock_path_lookup)
     assert folder is not None
-    problems = folder.build_dependency_graph(graph_parent_child_context)
+    problems = list(folder.build_dependency_graph(graph_parent_child_context))
     assert not problems
 
 
@@ -49,7 +49,7 @@ def test_folder_loads_content(mock_path_lookup, graph_parent_child_context) -> N
 
     folder = graph_parent_child_context.dependency.load(mock_path_lookup)
     assert folder is not None
-    folder.build_dependency_graph(graph_parent_child_context)
+    list(folder.build_dependency_graph(graph_parent_child_context))
 
     assert graph_parent_child_context.all_dependencies == expected_dependencies
 
@@ -63,7 +63,7 @@ def test_folder_cannot_load_unresolved_path(graph_parent_child_context) -> None:
     path_lookup.resolve.assert_called_once_with(graph_parent_child_context.dependency.path)
 
 
-@pytest.mark.parametrize("subdirectory", [".venv"])
+@pytest.mark.parametrize("subdirectory", [".venv", "node_modules"])
 def test_folder_build_dependency_graph_ignore_subdirectories(
     tmp_path, mock_path_lookup, simple_dependency_resolver, subdirectory: str
 ) -> None:
@@ -75,6 +75,153 @@ def test_folder_build_dependency_graph_ignore_subdirectories(
     graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
     folder = graph.dependency.load(mock_path_lookup)
     assert folder is not None
-    problems = folder.build_dependency_graph(graph)
+    problems = list(folder.build_dependency_graph(graph))
     assert not problems
     assert path not in mock_path_lookup.successfully_resolved_paths, "Subdirectory should be ignored"
+    assert not graph.local_dependencies, "Subdirectory should not be registered"
+
+
+def test_folder_build_dependency_graph_registers_files_and_subfolders(
+    tmp_path, mock_path_lookup, simple_dependency_resolver
+) -> None:
+    (tmp_path / "file.py").touch()
+    (tmp_path / "subfolder").mkdir()
+    (tmp_path / "subfolder" / "other.py").touch()
+    folder_loader = FolderLoader(NotebookLoader(), FileLoader())
+    dependency = Dependency(folder_loader, tmp_path, inherits_context=False)
+    graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
+    folder = graph.dependency.load(mock_path_lookup)
+    assert folder is not None
+
+    problems = list(folder.build_dependency_graph(graph))
+
+    assert not problems
+    assert graph.local_dependencies == {
+        Dependency(FileLoader(), tmp_path / "file.py"),
+        Dependency(folder_loader, tmp_path / "subfolder"),
+    }
+    assert Dependency(FileLoader(), tmp_path / "subfolder" / "other.py") in graph.all_dependencies
+
+
+def test_folder_walk_concurrent_lists_subfolders(tmp_path) -> None:
+    (tmp_path / "file.py").touch()
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "other.py").touch()
+    (tmp_path / ".git").mkdir()
+
+    listings = Folder.walk_concurrent(tmp_path, max_workers=2)
+
+    assert set(listings.keys()) == {tmp_path, tmp_path / "a", tmp_path / "a" / "b"}
+    assert set(listings[tmp_path]) == {
+        (tmp_path / "file.py", True),
+        (tmp_path / "a", False),
+        (tmp_path / ".git", False),
+    }
+    assert listings[tmp_path / "a" / "b"] == [(tmp_path / "a" / "b" / "other.py", True)]
+
+
+def test_folder_loader_lists_network_folder_concurrently(
+    tmp_path, mock_path_lookup, simple_dependency_resolver
+) -> None:
+    (tmp_path / "subfolder").mkdir()
+    (tmp_path / "subfolder" / "other.py").touch()
+    folder_loader = FolderLoader(NotebookLoader(), FileLoader())
+    dependency = Dependency(folder_loader, tmp_path, inherits_context=False)
+    graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
+
+    with patch("databricks.labs.ucx.source_code.folders._is_on_network_file_system", return_value=True):
+        with patch.object(Folder, "walk_concurrent", wraps=Folder.walk_concurrent) as walk_concurrent:
+            folder = graph.dependency.load(mock_path_lookup)
+            assert folder is not None
+            problems = list(folder.build_dependency_graph(graph))
+
+    assert not problems
+    walk_concurrent.assert_called_once_with(tmp_path, 16)
+    assert Dependency(FileLoader(), tmp_path / "subfolder" / "other.py") in graph.all_dependencies
+
+
+def test_folder_loader_looks_up_file_system_once_per_folder(
+    tmp_path, mock_path_lookup, simple_dependency_resolver
+) -> None:
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "other.py").touch()
+    folder_loader = FolderLoader(NotebookLoader(), FileLoader())
+    dependency = Dependency(folder_loader, tmp_path, inherits_context=False)
+    graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
+
+    with patch(
+        "databricks.labs.ucx.source_code.folders._is_on_network_file_system", return_value=False
+    ) as is_on_network_file_system:
+        folder = graph.dependency.load(mock_path_lookup)
+        assert folder is not None
+        problems = list(folder.build_dependency_graph(graph))
+
+    assert not problems
+    is_on_network_file_system.assert_called_once_with(tmp_path)
+    assert Dependency(FileLoader(), tmp_path / "a" / "b" / "other.py") in graph.all_dependencies
+
+
+def test_folder_loader_does_not_serve_listings_of_an_abandoned_walk(tmp_path, mock_path_lookup) -> None:
+    (tmp_path / "subfolder").mkdir()
+    folder_loader = FolderLoader(NotebookLoader(), FileLoader())
+    dependency = Dependency(folder_loader, tmp_path, inherits_context=False)
+
+    with patch("databricks.labs.ucx.source_code.folders._is_on_network_file_system", return_value=True):
+        assert folder_loader.load_dependency(mock_path_lookup, dependency) is not None  # Graph is not built
+        (tmp_path / "subfolder" / "other.py").touch()
+        subfolder_dependency = Dependency(folder_loader, tmp_path / "subfolder", inherits_context=False)
+        subfolder = folder_loader.load_dependency(mock_path_lookup, subfolder_dependency)
+
+    assert subfolder is not None
+    children = list(subfolder._iter_children())  # pylint: disable=protected-access
+    assert children == [(tmp_path / "subfolder" / "other.py", True)]
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        (Path("/mnt/nfs/project"), True),
+        (Path("/mnt/sshfs/project"), True),
+        (Path("/mnt/fuse/project"), False),
+        (Path("/home/project"), False),
+    ],
+)
+def test_is_on_network_file_system(path: Path, expected: bool) -> None:
+    mounts = [("/mnt/nfs", "nfs4"), ("/mnt/sshfs", "fuse.sshfs"), ("/mnt/fuse", "fuse"), ("/", "ext4")]
+    with patch("databricks.labs.ucx.source_code.folders._read_mounts", return_value=mounts):
+        assert _is_on_network_file_system(path) is expected
+
+
+def test_folder_walk_concurrent_does_not_follow_symlinked_folders(tmp_path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "file.py").touch()
+    (tmp_path / "a" / "up").symlink_to("..", target_is_directory=True)
+    (tmp_path / "a" / "self").symlink_to(".", target_is_directory=True)
+
+    listings = Folder.walk_concurrent(tmp_path, max_workers=2)
+
+    assert set(listings.keys()) == {tmp_path, tmp_path / "a"}
+    assert set(listings[tmp_path / "a"]) == {
+        (tmp_path / "a" / "file.py", True),
+        (tmp_path / "a" / "up", False),
+        (tmp_path / "a" / "self", False),
+    }
+
+
+def test_folder_loader_lists_network_folder_with_symlink_loop(
+    tmp_path, mock_path_lookup, simple_dependency_resolver
+) -> None:
+    (tmp_path / "subfolder").mkdir()
+    (tmp_path / "subfolder" / "other.py").touch()
+    (tmp_path / "subfolder" / "up").symlink_to("..", target_is_directory=True)
+    folder_loader = FolderLoader(NotebookLoader(), FileLoader())
+    dependency = Dependency(folder_loader, tmp_path, inherits_context=False)
+    graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
+
+    with patch("databricks.labs.ucx.source_code.folders._is_on_network_file_system", return_value=True):
+        folder = graph.dependency.load(mock_path_lookup)
+        assert folder is not None
+        problems = list(folder.build_dependency_graph(graph))
+
+    assert not problems
+    assert Dependency(FileLoader(), tmp_path / "subfolder" / "other.py") in graph.all_dependencies
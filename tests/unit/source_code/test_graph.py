@@ -1,6 +1,10 @@
-from pathlib import Path
+import sys
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from unittest.mock import create_autospec
 
 import pytest
+from databricks.labs.blueprint.paths import WorkspacePath
+from databricks.sdk import WorkspaceClient
 
 from databricks.labs.ucx.source_code.base import Advisory, CurrentSessionState, LocatedAdvice
 from databricks.labs.ucx.source_code.folders import FolderLoader
@@ -35,7 +39,7 @@ def test_root_dependencies_returns_only_files(mock_path_lookup, simple_dependenc
     container = dependency.load(mock_path_lookup)
     assert container is not None
     graph = DependencyGraph(dependency, None, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
-    container.build_dependency_graph(graph)
+    list(container.build_dependency_graph(graph))
     roots = graph.root_dependencies
     actual = list(root.path for root in roots)
     assert actual == [path / "grand_parent.py"]
@@ -105,7 +109,7 @@ def test_graph_computes_magic_run_route_recursively_in_parent_folder(
     root_graph = dependency_graph_factory(dependency)
     container = dependency.load(mock_path_lookup)
     assert container is not None
-    container.build_dependency_graph(root_graph)
+    list(container.build_dependency_graph(root_graph))
     roots = root_graph.root_dependencies
     assert len(roots) == 1
     assert grand_parent in [dep.path for dep in roots]
@@ -182,6 +186,44 @@ def test_graph_builds_inherited_context(mock_path_lookup, simple_dependency_reso
     assert not inference_context.tree.has_global("other_table_name")
 
 
+def test_graph_visits_deeply_nested_dependencies(mock_path_lookup, simple_dependency_resolver) -> None:
+    depth = 2 * sys.getrecursionlimit()
+    root = DependencyGraph(
+        Dependency(FileLoader(), Path("0.py")),
+        None,
+        simple_dependency_resolver,
+        mock_path_lookup,
+        CurrentSessionState(),
+    )
+    graph = root
+    for index in range(1, depth):
+        dependency = Dependency(FileLoader(), Path(f"{index}.py"))
+        child = DependencyGraph(dependency, graph, simple_dependency_resolver, mock_path_lookup, CurrentSessionState())
+        graph.dependencies[dependency] = child
+        graph = child
+    visited: list[Path] = []
+
+    root.visit(lambda graph: visited.append(graph.dependency.path), set())
+
+    assert visited == [Path(f"{index}.py") for index in range(depth)]
+
+
+def test_dependencies_with_equal_paths_are_equal() -> None:
+    dependency = Dependency(FileLoader(), PureWindowsPath("C:/Project/File.py"))  # type: ignore[arg-type]
+    other = Dependency(FileLoader(), PureWindowsPath("c:/project/file.py"))  # type: ignore[arg-type]
+
+    assert dependency == other
+    assert len({dependency, other}) == 1
+
+
+def test_dependencies_with_different_path_types_are_not_equal() -> None:
+    ws = create_autospec(WorkspaceClient)
+    dependency = Dependency(FileLoader(), WorkspacePath(ws, "/project/file.py"))
+    other = Dependency(FileLoader(), PurePosixPath("/project/file.py"))  # type: ignore[arg-type]
+
+    assert dependency != other
+
+
 def test_dependency_problem_has_path_missing_by_default() -> None:
     problem = DependencyProblem("code", "message")
     assert problem.has_missing_path()
@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
@@ -51,3 +52,35 @@ def test_lookup_removes_path(tmp_path) -> None:
     provider.remove_path(1)
     sys_paths.pop(1)
     assert provider.library_roots[1:] == sys_paths
+
+
+def test_lookup_with_resolve_cache_resolves_once(tmp_path) -> None:
+    (tmp_path / "module.py").touch()
+    lookup = PathLookup(tmp_path, []).with_resolve_cache()
+
+    assert lookup.resolve(Path("module.py")) == tmp_path / "module.py"
+    (tmp_path / "module.py").unlink()
+    # The cache is shared with the path lookups created by changing directory
+    assert lookup.change_directory(tmp_path).resolve(Path("module.py")) == tmp_path / "module.py"
+
+
+def test_lookup_with_resolve_cache_resolves_again_after_changing_sys_paths(tmp_path) -> None:
+    library = tmp_path / "library"
+    library.mkdir()
+    (library / "module.py").touch()
+    lookup = PathLookup(tmp_path, []).with_resolve_cache()
+
+    assert lookup.resolve(Path("module.py")) is None
+    lookup.append_path(library)
+    assert lookup.resolve(Path("module.py")) == library / "module.py"
+
+
+def test_lookup_with_resolve_cache_is_pickled_without_resolved_paths(tmp_path) -> None:
+    (tmp_path / "module.py").touch()
+    lookup = PathLookup(tmp_path, []).with_resolve_cache()
+    assert lookup.resolve(Path("module.py")) == tmp_path / "module.py"
+    (tmp_path / "module.py").unlink()
+
+    unpickled_lookup = pickle.loads(pickle.dumps(lookup))
+
+    assert unpickled_lookup.resolve(Path("module.py")) is None
@@ -75,6 +75,7 @@ from databricks.labs.ucx.hive_metastore import TablesCrawler, ExternalLocations
 from databricks.labs.ucx.hive_metastore.locations import ExternalLocation
 from databricks.labs.ucx.hive_metastore.tables import Table
 from databricks.labs.ucx.progress.install import VerifyProgressTracking
+from databricks.labs.ucx.source_code.base import Advisory, LocatedAdvice
 from databricks.labs.ucx.source_code.linters.folders import LocalCodeLinter
 from databricks.labs.ucx.source_code.linters.redash import Redash
 
@@ -957,6 +958,15 @@ def test_lint_local_code(ws) -> None:
         mock_apply.assert_called_once_with(Path.cwd())
 
 
+def test_lint_local_code_prints_advices(ws, capsys) -> None:
+    prompts = MockPrompts({'.*': 'yes'})
+    advices = [LocatedAdvice(Advisory("code", f"message {i}", i, 0, i, 1), Path("file.py")) for i in range(100)]
+    with patch.object(LocalCodeLinter, 'lint', return_value=advices):
+        lint_local_code(ws, prompts, Path.cwd().as_posix())
+
+    assert capsys.readouterr().out.splitlines() == [str(advice) for advice in advices]
+
+
 def test_migrate_local_code(ws) -> None:
     prompts = MockPrompts({'.*': 'yes'})
     with patch.object(LocalCodeLinter, 'apply') as mock_apply: